@@ -12,9 +12,12 @@ MAX_AUDIO_SIZE_MB = int(os.getenv("MAX_AUDIO_SIZE_MB", "100"))
 HUGGINGFACE_CACHE = os.getenv("HUGGINGFACE_CACHE", os.path.expanduser("~/.cache/huggingface"))
 
 # Supported models (MLX-optimized Whisper models from HuggingFace)
-SUPPORTED_MODELS = [
+SUPPORTED_MODELS = (
     "mlx-community/whisper-tiny-mlx",
     "mlx-community/whisper-small-mlx",
     "mlx-community/whisper-large-v3-mlx",
     "mlx-community/whisper-large-v3-mlx-8bit",
-]
+)
+
+# Set form of SUPPORTED_MODELS for membership checks (the tuple keeps display order)
+SUPPORTED_MODELS_SET = frozenset(SUPPORTED_MODELS)
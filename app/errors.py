@@ -8,12 +8,13 @@ This module provides:
 
 import logging
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, Sequence
 
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
+from app.responses import FastORJSONResponse
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,14 +100,22 @@ class APIException(Exception):
         super().__init__(message)
 
     def to_response(self, request_id: Optional[str] = None) -> APIError:
-        """Convert exception to API error response."""
-        return APIError(
+        """Convert exception to API error response.
+
+        Fields come from our own typed exception attributes, so the model
+        is built without re-running validation.
+        """
+        return APIError.model_construct(
             error=self.message,
             code=self.code,
             details=self.details,
             request_id=request_id,
         )
 
+    def to_content(self, request_id: Optional[str] = None) -> dict[str, Any]:
+        """Build the JSON-ready response body for this exception."""
+        return self.to_response(request_id=request_id).model_dump(exclude_none=True)
+
 
 # Pre-defined exception classes for common errors
 class ValidationError(APIException):
@@ -129,13 +138,30 @@ class ValidationError(APIException):
 class UnsupportedFormatError(ValidationError):
     """Exception for unsupported audio format."""
 
-    def __init__(self, format: str, supported_formats: list[str]):
+    def __init__(self, format: str, supported_formats: Sequence[str]):
+        # supported_formats is stored as given; callers pass a shared
+        # immutable tuple, which serializes as a JSON array
         super().__init__(
             message=f"Unsupported audio format: {format}",
             code=ErrorCode.VALIDATION_UNSUPPORTED_FORMAT,
             details={"format": format, "supported_formats": supported_formats},
         )
 
+    def to_content(self, request_id: Optional[str] = None) -> dict[str, Any]:
+        """Build the response body directly from its fixed shape.
+
+        Rejected uploads are a cheap, high-volume path, so this skips
+        constructing and dumping an APIError model.
+        """
+        content: dict[str, Any] = {
+            "error": self.message,
+            "code": self.code.value,
+            "details": self.details,
+        }
+        if request_id is not None:
+            content["request_id"] = request_id
+        return content
+
 
 class FileTooLargeError(APIException):
     """Exception for files exceeding size limit."""
@@ -270,7 +296,7 @@ class TranscriptionFailedError(APIException):
         )
 
 
-async def api_exception_handler(request: Request, exc: APIException) -> JSONResponse:
+async def api_exception_handler(request: Request, exc: APIException) -> FastORJSONResponse:
     """Handle APIException and return standardized JSON response."""
     request_id = getattr(request.state, "request_id", None)
 
@@ -282,13 +308,13 @@ async def api_exception_handler(request: Request, exc: APIException) -> JSONResp
         request_id,
     )
 
-    return JSONResponse(
+    return FastORJSONResponse(
         status_code=exc.status_code,
-        content=exc.to_response(request_id=request_id).model_dump(exclude_none=True),
+        content=exc.to_content(request_id=request_id),
     )
 
 
-async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def unhandled_exception_handler(request: Request, exc: Exception) -> FastORJSONResponse:
     """Handle unhandled exceptions with a generic error response."""
     request_id = getattr(request.state, "request_id", None)
 
@@ -298,13 +324,13 @@ async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONR
         str(exc),
     )
 
-    error = APIError(
+    error = APIError.model_construct(
         error="An internal server error occurred",
         code=ErrorCode.SERVER_INTERNAL_ERROR,
         request_id=request_id,
     )
 
-    return JSONResponse(
+    return FastORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=error.model_dump(exclude_none=True),
     )
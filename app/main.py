@@ -14,6 +14,7 @@ from app.routers import transcribe, models
 from app.schemas.models import HealthResponse, ErrorResponse
 from app.errors import APIException, api_exception_handler, unhandled_exception_handler
 from app.middleware import RequestIDMiddleware, LoggingMiddleware, setup_logging
+from app.responses import FastORJSONResponse
 
 # Configure logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -81,6 +82,7 @@ app = FastAPI(
     version=API_VERSION,
     openapi_tags=OPENAPI_TAGS,
     lifespan=lifespan,
+    default_response_class=FastORJSONResponse,
     responses={
         500: {
             "model": ErrorResponse,
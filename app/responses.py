@@ -0,0 +1,32 @@
+"""Response classes for the MLX Whisper API.
+
+Provides an orjson-backed default response class so JSON bodies are
+serialized in C without a per-field type walk.
+"""
+
+from pathlib import PurePath
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values orjson does not handle natively."""
+    if isinstance(obj, PurePath):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class FastORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes paths and non-string dict keys.
+
+    datetimes, dataclasses, and enums are handled natively by orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
@@ -4,12 +4,14 @@ Provides endpoints for listing, downloading, and deleting MLX Whisper models.
 """
 
 import logging
+from dataclasses import asdict
 from urllib.parse import unquote
 
-from fastapi import APIRouter, Path, Request
+from fastapi import APIRouter, Depends, Path, Request
+from fastapi.responses import ORJSONResponse, Response
+from starlette.convertors import Convertor, register_url_convertor
 
 from app.schemas.models import (
-    ModelInfo,
     ModelListResponse,
     ModelStatusResponse,
     DownloadResponse,
@@ -22,6 +24,7 @@ from app.errors import (
     ModelNotDownloadedError as APIModelNotDownloadedError,
 )
 from app.services.model_manager import (
+    ModelManager,
     get_model_manager,
     ModelNotFoundError,
     ModelAlreadyDownloadedError,
@@ -30,6 +33,26 @@ from app.services.model_manager import (
 
 logger = logging.getLogger(__name__)
 
+
+class ModelIdConvertor(Convertor):
+    """Path convertor that URL-decodes model IDs (handles %2F -> /).
+
+    Decoding happens once at routing time, so handlers receive the
+    canonical model ID. Unsupported IDs still reach the handler so they
+    get the structured MODEL_NOT_FOUND error response.
+    """
+
+    regex = ".*"
+
+    def convert(self, value: str) -> str:
+        return unquote(value)
+
+    def to_string(self, value: str) -> str:
+        return value
+
+
+register_url_convertor("model_id", ModelIdConvertor())
+
 router = APIRouter(prefix="/models", tags=["models"])
 
 
@@ -56,34 +79,38 @@ Each model includes:
         },
     },
 )
-async def list_models(request: Request) -> ModelListResponse:
+async def list_models(
+    request: Request,
+    manager: ModelManager = Depends(get_model_manager),
+) -> Response:
     """List all supported models and their status.
 
     Returns a list of all supported MLX Whisper models with metadata
     parsed from the model ID and current download status.
 
+    The manager serves a cached, pre-serialized body that is refreshed
+    on download/delete events; ``response_model`` only documents it.
+
     Args:
         request: FastAPI request object
+        manager: Model manager (injected)
 
     Returns:
-        ModelListResponse containing list of all models with metadata and status
+        JSON response with a ModelListResponse body of all models with metadata and status
     """
     request_id = getattr(request.state, "request_id", None)
-    manager = get_model_manager()
-
-    models = manager.list_models()
+    body = manager.list_models_json()
 
     logger.debug(
-        "Listed %d models (request_id=%s)",
-        len(models),
+        "Listed models (request_id=%s)",
         request_id,
     )
 
-    return ModelListResponse(models=[ModelInfo(**m) for m in models])
+    return Response(content=body, media_type="application/json")
 
 
 @router.get(
-    "/{model_id:path}/status",
+    "/{model_id:model_id}/status",
     response_model=ModelStatusResponse,
     summary="Get model status",
     description="""
@@ -121,7 +148,8 @@ async def get_model_status(
         description="Model identifier (URL-encoded if contains '/'). Example: mlx-community%2Fwhisper-tiny-mlx",
         examples=["mlx-community/whisper-tiny-mlx"],
     ),
-) -> ModelStatusResponse:
+    manager: ModelManager = Depends(get_model_manager),
+) -> ORJSONResponse:
     """Get detailed status of a specific model.
 
     Checks the HuggingFace cache to determine if the model is downloaded
@@ -130,20 +158,16 @@ async def get_model_status(
     Args:
         request: FastAPI request object
         model_id: Model identifier (e.g., "mlx-community/whisper-tiny-mlx")
+        manager: Model manager (injected)
 
     Returns:
-        ModelStatusResponse with detailed status information
+        ORJSONResponse with a ModelStatusResponse body of detailed status information
 
     Raises:
         ModelNotFoundError: If model is not in the supported list
     """
     request_id = getattr(request.state, "request_id", None)
 
-    # URL-decode the model_id (handles %2F -> /)
-    model_id = unquote(model_id)
-
-    manager = get_model_manager()
-
     try:
         status = manager.get_model_status(model_id)
 
@@ -154,16 +178,8 @@ async def get_model_status(
             request_id,
         )
 
-        return ModelStatusResponse(
-            id=status.id,
-            status=status.status,
-            path=status.path,
-            size_bytes=status.size_bytes,
-            progress=status.progress,
-            downloaded_bytes=status.downloaded_bytes,
-            total_bytes=status.total_bytes,
-            error=status.error,
-        )
+        # ModelStatus fields mirror ModelStatusResponse one-to-one
+        return ORJSONResponse(asdict(status))
     except ModelNotFoundError as e:
         logger.warning(
             "Model not found: %s (request_id=%s)",
@@ -174,7 +190,7 @@ async def get_model_status(
 
 
 @router.post(
-    "/{model_id:path}/download",
+    "/{model_id:model_id}/download",
     response_model=DownloadResponse,
     summary="Download a model",
     description="""
@@ -225,7 +241,8 @@ async def download_model(
         description="Model identifier (URL-encoded if contains '/'). Example: mlx-community%2Fwhisper-tiny-mlx",
         examples=["mlx-community/whisper-tiny-mlx"],
     ),
-) -> DownloadResponse:
+    manager: ModelManager = Depends(get_model_manager),
+) -> ORJSONResponse:
     """Initiate download of a model.
 
     The download runs in the background using a separate thread.
@@ -234,9 +251,10 @@ async def download_model(
     Args:
         request: FastAPI request object
         model_id: Model identifier (e.g., "mlx-community/whisper-tiny-mlx")
+        manager: Model manager (injected)
 
     Returns:
-        DownloadResponse with status information
+        ORJSONResponse with a DownloadResponse body of status information
 
     Raises:
         ModelNotFoundError: If model is not in the supported list
@@ -244,11 +262,6 @@ async def download_model(
     """
     request_id = getattr(request.state, "request_id", None)
 
-    # URL-decode the model_id (handles %2F -> /)
-    model_id = unquote(model_id)
-
-    manager = get_model_manager()
-
     try:
         manager.start_download_async(model_id)
 
@@ -258,11 +271,11 @@ async def download_model(
             request_id,
         )
 
-        return DownloadResponse(
-            id=model_id,
-            status="download_started",
-            message=f"Model download initiated. Check /models/{model_id}/status for progress.",
-        )
+        return ORJSONResponse({
+            "id": model_id,
+            "status": "download_started",
+            "message": f"Model download initiated. Check /models/{model_id}/status for progress.",
+        })
     except ModelNotFoundError as e:
         logger.warning(
             "Download failed - model not found: %s (request_id=%s)",
@@ -280,7 +293,7 @@ async def download_model(
 
 
 @router.delete(
-    "/{model_id:path}",
+    "/{model_id:model_id}",
     response_model=DeleteResponse,
     summary="Delete a model",
     description="""
@@ -331,7 +344,8 @@ async def delete_model(
         description="Model identifier (URL-encoded if contains '/'). Example: mlx-community%2Fwhisper-tiny-mlx",
         examples=["mlx-community/whisper-tiny-mlx"],
     ),
-) -> DeleteResponse:
+    manager: ModelManager = Depends(get_model_manager),
+) -> ORJSONResponse:
     """Delete a downloaded model from the cache.
 
     Removes all model files from the HuggingFace cache directory
@@ -340,9 +354,10 @@ async def delete_model(
     Args:
         request: FastAPI request object
         model_id: Model identifier (e.g., "mlx-community/whisper-tiny-mlx")
+        manager: Model manager (injected)
 
     Returns:
-        DeleteResponse confirming deletion
+        ORJSONResponse with a DeleteResponse body confirming deletion
 
     Raises:
         ModelNotFoundError: If model is not in the supported list
@@ -350,11 +365,6 @@ async def delete_model(
     """
     request_id = getattr(request.state, "request_id", None)
 
-    # URL-decode the model_id (handles %2F -> /)
-    model_id = unquote(model_id)
-
-    manager = get_model_manager()
-
     try:
         manager.delete_model(model_id)
 
@@ -364,10 +374,10 @@ async def delete_model(
             request_id,
         )
 
-        return DeleteResponse(
-            id=model_id,
-            status="deleted",
-        )
+        return ORJSONResponse({
+            "id": model_id,
+            "status": "deleted",
+        })
     except ModelNotFoundError as e:
         logger.warning(
             "Delete failed - model not found: %s (request_id=%s)",
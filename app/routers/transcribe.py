@@ -4,11 +4,15 @@ Provides the POST /transcribe endpoint for audio-to-text transcription.
 """
 
 import logging
+import os
+import tempfile
 from typing import Optional
 
-from fastapi import APIRouter, File, Form, UploadFile, Request
+from fastapi import APIRouter, Depends, File, Form, UploadFile, Request
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 
-from app.config import DEFAULT_MODEL, MAX_AUDIO_SIZE_MB, SUPPORTED_MODELS
+from app.config import DEFAULT_MODEL, MAX_AUDIO_SIZE_MB, SUPPORTED_MODELS_SET
 from app.schemas.models import TranscriptionResponse, ErrorResponse
 from app.errors import (
     EmptyFileError,
@@ -31,7 +35,7 @@ from app.services.transcription import (
     ModelNotDownloadedError,
     UnsupportedModelError,
 )
-from app.services.model_manager import get_model_manager
+from app.services.model_manager import ModelManager, get_model_manager
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +44,61 @@ router = APIRouter()
 # Max file size in bytes
 MAX_FILE_SIZE = MAX_AUDIO_SIZE_MB * 1024 * 1024
 
+# Chunk size used when copying uploads to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def get_max_file_size() -> int:
+    """Get the maximum accepted upload size in bytes.
+
+    Returns:
+        Upload size limit in bytes
+    """
+    return MAX_FILE_SIZE
+
+
+async def _save_upload(
+    file: UploadFile, suffix: str, max_size: int
+) -> tuple[str, int]:
+    """Copy an uploaded file to a temporary file in fixed-size chunks.
+
+    The size limit is enforced while copying, so oversized uploads are
+    rejected without ever being held in memory.
+
+    Args:
+        file: Uploaded file to copy
+        suffix: File extension for the temporary file (e.g., ".wav")
+        max_size: Upload size limit in bytes
+
+    Returns:
+        Tuple of (temporary file path, size in bytes)
+
+    Raises:
+        FileTooLargeError: If the upload exceeds max_size
+        EmptyFileError: If the upload is empty
+    """
+    # The multipart parser usually knows the size up front
+    if file.size is not None and file.size > max_size:
+        raise FileTooLargeError(file.size, max_size)
+
+    size = 0
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        tmp_path = tmp.name
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise FileTooLargeError(size, max_size)
+                await run_in_threadpool(tmp.write, chunk)
+            if size == 0:
+                raise EmptyFileError()
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp_path)
+            raise
+
+    return tmp_path, size
+
 
 @router.post(
     "/transcribe",
@@ -150,7 +209,9 @@ async def transcribe_audio(
         default=None,
         description=f"Initial prompt to guide transcription. Useful for providing context, terminology, or speaker names. Max {MAX_PROMPT_LENGTH} characters.",
     ),
-) -> TranscriptionResponse:
+    manager: ModelManager = Depends(get_model_manager),
+    max_file_size: int = Depends(get_max_file_size),
+) -> ORJSONResponse:
     """Transcribe an audio file to text.
 
     Accepts audio files in various formats and returns the transcribed text
@@ -168,9 +229,11 @@ async def transcribe_audio(
         model: Model identifier from supported list
         language: Two-letter ISO 639-1 language code
         prompt: Text prompt to provide context for transcription
+        manager: Model manager used to check model readiness (injected)
+        max_file_size: Upload size limit in bytes (injected)
 
     Returns:
-        TranscriptionResponse with transcribed text, detected language, and model used
+        ORJSONResponse with a TranscriptionResponse body of transcribed text, detected language, and model used
 
     Raises:
         UnsupportedFormatError: If audio format is not supported
@@ -183,33 +246,61 @@ async def transcribe_audio(
         TranscriptionFailedError: If transcription fails
     """
     request_id = getattr(request.state, "request_id", None)
-    service = get_transcription_service()
 
     # Sanitize and validate filename
     filename = sanitize_filename(file.filename)
 
     # Validate audio format
-    validate_audio_format(filename)
+    ext = validate_audio_format(filename)
 
     # Validate optional parameters
     validated_language = validate_language(language)
     validated_prompt = validate_prompt(prompt)
 
-    # Read file content
-    content = await file.read()
-
-    # Check file size
-    if len(content) > MAX_FILE_SIZE:
-        raise FileTooLargeError(len(content), MAX_FILE_SIZE)
+    # Stream the upload to disk, checking size and emptiness as we go
+    tmp_path, file_size = await _save_upload(file, suffix=ext, max_size=max_file_size)
+    try:
+        # Model status checks and inference block, so keep them off the event loop
+        return await run_in_threadpool(
+            _transcribe_saved_upload,
+            manager=manager,
+            request_id=request_id,
+            audio_path=tmp_path,
+            filename=filename,
+            file_size=file_size,
+            model=model,
+            language=validated_language,
+            prompt=validated_prompt,
+        )
+    finally:
+        # Clean up temporary file
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _transcribe_saved_upload(
+    manager: ModelManager,
+    request_id: Optional[str],
+    audio_path: str,
+    filename: str,
+    file_size: int,
+    model: Optional[str],
+    language: Optional[str],
+    prompt: Optional[str],
+) -> ORJSONResponse:
+    """Check model readiness and transcribe an upload saved to disk.
 
-    # Check for empty file
-    if len(content) == 0:
-        raise EmptyFileError()
+    Raises:
+        ModelUnsupportedError: If model is not in supported list
+        ModelNotDownloadedError: If model is not downloaded
+        ModelDownloadFailedError: If model is present but not usable
+        TranscriptionFailedError: If transcription fails
+    """
+    service = get_transcription_service()
 
     # Require explicit model validation before transcription.
     selected_model = model or DEFAULT_MODEL
-    if selected_model in SUPPORTED_MODELS:
-        manager = get_model_manager()
+    if selected_model in SUPPORTED_MODELS_SET:
         model_status = manager.get_model_status(selected_model)
         encoded_model_id = selected_model.replace("/", "%2F")
         download_url = f"/models/{encoded_model_id}/download"
@@ -228,19 +319,18 @@ async def transcribe_audio(
     logger.info(
         "Transcribing audio: filename=%s, size=%d bytes, model=%s, language=%s (request_id=%s)",
         filename,
-        len(content),
+        file_size,
         model or DEFAULT_MODEL,
-        validated_language or "auto",
+        language or "auto",
         request_id,
     )
 
     try:
-        result = await service.transcribe_upload(
-            file_content=content,
-            filename=filename,
+        result = service.transcribe(
+            audio_path=audio_path,
             model=model,
-            language=validated_language,
-            prompt=validated_prompt,
+            language=language,
+            prompt=prompt,
         )
 
         logger.info(
@@ -250,7 +340,7 @@ async def transcribe_audio(
             request_id,
         )
 
-        return TranscriptionResponse(**result)
+        return ORJSONResponse(result)
 
     except UnsupportedModelError as e:
         logger.warning(
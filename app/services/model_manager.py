@@ -4,21 +4,24 @@ from __future__ import annotations
 
 import gc
 import json
+import os
 import re
 import shutil
 import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
 from huggingface_hub import scan_cache_dir, snapshot_download
-from mlx_whisper.load_models import load_model
 
-from app.config import HUGGINGFACE_CACHE, SUPPORTED_MODELS
+from app.config import HUGGINGFACE_CACHE, SUPPORTED_MODELS, SUPPORTED_MODELS_SET
 
 
-@dataclass
+@dataclass(frozen=True)
 class ModelMetadata:
     """Parsed metadata from a model ID."""
 
@@ -29,7 +32,7 @@ class ModelMetadata:
     english_only: bool
 
 
-@dataclass
+@dataclass(frozen=True)
 class ModelStatus:
     """Status information for a model."""
 
@@ -43,6 +46,16 @@ class ModelStatus:
     error: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class DownloadProgress:
+    """Snapshot of an in-flight or failed model download."""
+
+    progress: float = 0.0
+    downloaded_bytes: Optional[int] = None
+    total_bytes: Optional[int] = None
+    error: Optional[str] = None
+
+
 class ModelNotFoundError(Exception):
     """Exception raised when a model ID is not in the supported list."""
 
@@ -76,23 +89,137 @@ class ModelDownloadError(Exception):
         super().__init__(f"Failed to download model '{model_id}': {message}")
 
 
+# Size display names
+SIZE_NAMES = {
+    "tiny": "Tiny",
+    "small": "Small",
+    "large": "Large",
+    "large-v3": "Large V3",
+}
+
+
+# Quantization suffix on a model name, either "-q<N>" or "-<N>bit"
+_QUANT_SUFFIX_RE = re.compile(r"-(q\d+|\d+bit)$")
+
+
+@lru_cache(maxsize=128)
+def _parse_model_id(model_id: str) -> ModelMetadata:
+    """Parse a model ID into metadata (see ModelManager.parse_model_id).
+
+    Parsing is a pure function of the ID and ModelMetadata is frozen,
+    so results are memoized and shared between callers.
+    """
+    # Extract the model name part after the org prefix
+    if "/" in model_id:
+        _, model_name = model_id.split("/", 1)
+    else:
+        model_name = model_id
+
+    # Remove "whisper-" prefix
+    model_name = model_name.replace("whisper-", "")
+
+    quantization = None
+
+    # Remove "-mlx" suffix (handles both "-mlx" at end and "-mlx-" in middle)
+    model_name = model_name.replace("-mlx", "")
+
+    # Extract quantization suffix (e.g., -q8, -q4, -8bit, -4bit)
+    quant_match = _QUANT_SUFFIX_RE.search(model_name)
+    if quant_match:
+        quantization = quant_match.group(1)
+        model_name = model_name[: quant_match.start()]
+
+    # Check for English-only variant
+    english_only = ".en" in model_name
+    model_name = model_name.replace(".en", "")
+
+    # Determine size
+    size = _extract_size(model_name)
+
+    # Build display name
+    display_name = _build_display_name(size, english_only, quantization)
+
+    return ModelMetadata(
+        id=model_id,
+        name=display_name,
+        size=size,
+        quantization=quantization,
+        english_only=english_only,
+    )
+
+
+def _extract_size(model_name: str) -> str:
+    """Extract the model size from the parsed name."""
+    if "large-v3" in model_name:
+        return "large-v3"
+    elif "large" in model_name:
+        return "large"
+    elif "small" in model_name:
+        return "small"
+    elif "tiny" in model_name:
+        return "tiny"
+    return "unknown"
+
+
+def _build_display_name(
+    size: str, english_only: bool, quantization: Optional[str]
+) -> str:
+    """Build a human-readable display name for the model."""
+    size_name = SIZE_NAMES.get(size, size.title())
+    name = f"Whisper {size_name}"
+
+    if english_only:
+        name += " English"
+
+    if quantization:
+        name += f" ({quantization.upper()})"
+
+    return name
+
+
+# Supported model IDs are known at import time, so parse them once here;
+# parse_model_id only falls back to parsing for other IDs
+SUPPORTED_MODEL_METADATA: dict[str, ModelMetadata] = {
+    model_id: _parse_model_id(model_id) for model_id in SUPPORTED_MODELS
+}
+
+# Static fields of each supported model's info dict; get_model_info only
+# adds the live status fields on top
+SUPPORTED_MODEL_INFO: dict[str, dict[str, Any]] = {
+    model_id: {
+        "id": metadata.id,
+        "name": metadata.name,
+        "size": metadata.size,
+        "quantization": metadata.quantization,
+        "english_only": metadata.english_only,
+    }
+    for model_id, metadata in SUPPORTED_MODEL_METADATA.items()
+}
+
+
 class ModelManager:
     """Service for managing MLX Whisper models and validation state."""
 
     VALIDATION_STATE_WORKING = "working"
     VALIDATION_STATE_BROKEN = "broken"
 
-    # Size display names
-    SIZE_NAMES = {
-        "tiny": "Tiny",
-        "small": "Small",
-        "large": "Large",
-        "large-v3": "Large V3",
-    }
+    # Seconds the HF cache scan, cached model statuses and the serialized
+    # model list stay fresh without an invalidating event; bounds staleness
+    # from cache changes made outside this process
+    CACHE_TTL_SECONDS = 5.0
+
+    # Background downloads allowed to transfer at once; further requests
+    # are tracked as downloading but wait for a free slot
+    MAX_CONCURRENT_DOWNLOADS = 2
 
     def __init__(self):
         """Initialize the model manager."""
-        self._download_progress: dict[str, dict] = {}
+        # Progress entries are immutable snapshots replaced with a single
+        # assignment, so status polling reads them without taking a lock
+        self._download_progress: dict[str, DownloadProgress] = {}
+        # Serializes the check-and-set that starts a download
+        self._progress_lock = threading.Lock()
+        self._download_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_DOWNLOADS)
         self._state_lock = threading.Lock()
         configured_cache = Path(HUGGINGFACE_CACHE).expanduser()
         if configured_cache.name == "hub":
@@ -108,6 +235,16 @@ class ModelManager:
             / "model_validation_state.json"
         )
         self._validation_state = self._load_validation_state()
+        self._repo_cache: Optional[tuple[float, dict[str, Any]]] = None
+        self._status_cache: dict[str, tuple[float, ModelStatus]] = {}
+        # Directory sizes keyed by cache path, tagged with the cache
+        # fingerprint they were measured under
+        self._size_cache: dict[str, tuple[Optional[dict[str, Any]], int]] = {}
+        self._list_cache: Optional[tuple[float, bytes]] = None
+        self._cache_generation = 0
+        # Makes the generation compare-and-store atomic with invalidation;
+        # cache reads stay lock-free
+        self._cache_lock = threading.Lock()
 
     def _load_validation_state(self) -> dict[str, dict[str, Any]]:
         """Load persisted validation state from disk."""
@@ -151,6 +288,7 @@ class ModelManager:
         with self._state_lock:
             self._validation_state[model_id] = payload
             self._save_validation_state()
+        self._invalidate_caches()
 
     def _clear_validation_state(self, model_id: str) -> None:
         """Remove and persist validation state for a model."""
@@ -158,6 +296,7 @@ class ModelManager:
             if model_id in self._validation_state:
                 del self._validation_state[model_id]
                 self._save_validation_state()
+        self._invalidate_caches()
 
     def _get_validation_state(self, model_id: str) -> Optional[dict[str, Any]]:
         """Get validation state for a model."""
@@ -165,16 +304,36 @@ class ModelManager:
             state = self._validation_state.get(model_id)
             return dict(state) if isinstance(state, dict) else None
 
-    def _get_repo_cache_info(self, model_id: str) -> Any:
-        """Get cached HuggingFace repo metadata for a model."""
+    def _get_cached_repos(self) -> dict[str, Any]:
+        """Get HuggingFace cache repo metadata keyed by repo ID.
+
+        scan_cache_dir walks the whole hub cache, so one scan is shared by
+        every lookup until an invalidating event or the TTL expires.
+        """
+        now = time.monotonic()
+        cached = self._repo_cache
+        if cached is not None and now - cached[0] < self.CACHE_TTL_SECONDS:
+            return cached[1]
+
+        generation = self._cache_generation
         try:
             cache_info = scan_cache_dir(str(self._hf_hub_cache_path))
-            for repo in cache_info.repos:
-                if repo.repo_id == model_id:
-                    return repo
+            repos = {repo.repo_id: repo for repo in cache_info.repos}
         except Exception:
-            pass
-        return None
+            # Don't cache a failed scan, or statuses derived from it; the
+            # next lookup rescans
+            with self._cache_lock:
+                self._cache_generation += 1
+            return {}
+        # Don't cache a scan taken across an invalidation
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._repo_cache = (now, repos)
+        return repos
+
+    def _get_repo_cache_info(self, model_id: str) -> Any:
+        """Get cached HuggingFace repo metadata for a model."""
+        return self._get_cached_repos().get(model_id)
 
     def _get_latest_revision(self, repo_info: Any) -> Any:
         """Get the latest cached revision for a repo."""
@@ -225,78 +384,14 @@ class ModelManager:
         Returns:
             ModelMetadata with parsed information
         """
-        # Extract the model name part after the org prefix
-        if "/" in model_id:
-            _, model_name = model_id.split("/", 1)
-        else:
-            model_name = model_id
-
-        # Remove "whisper-" prefix
-        model_name = model_name.replace("whisper-", "")
-
-        quantization = None
-
-        # Remove "-mlx" suffix (handles both "-mlx" at end and "-mlx-" in middle)
-        model_name = model_name.replace("-mlx", "")
-
-        # Extract quantization suffix (e.g., -q8, -q4, -8bit, -4bit)
-        quant_match = re.search(r"-q(\d+)$", model_name)
-        bit_match = re.search(r"-(\d+bit)$", model_name)
-        if quant_match:
-            quantization = f"q{quant_match.group(1)}"
-            model_name = model_name[: quant_match.start()]
-        elif bit_match:
-            quantization = bit_match.group(1)
-            model_name = model_name[: bit_match.start()]
-
-        # Check for English-only variant
-        english_only = ".en" in model_name
-        model_name = model_name.replace(".en", "")
-
-        # Determine size
-        size = self._extract_size(model_name)
-
-        # Build display name
-        display_name = self._build_display_name(size, english_only, quantization)
-
-        return ModelMetadata(
-            id=model_id,
-            name=display_name,
-            size=size,
-            quantization=quantization,
-            english_only=english_only,
-        )
-
-    def _extract_size(self, model_name: str) -> str:
-        """Extract the model size from the parsed name."""
-        if "large-v3" in model_name:
-            return "large-v3"
-        elif "large" in model_name:
-            return "large"
-        elif "small" in model_name:
-            return "small"
-        elif "tiny" in model_name:
-            return "tiny"
-        return "unknown"
-
-    def _build_display_name(
-        self, size: str, english_only: bool, quantization: Optional[str]
-    ) -> str:
-        """Build a human-readable display name for the model."""
-        size_name = self.SIZE_NAMES.get(size, size.title())
-        name = f"Whisper {size_name}"
-
-        if english_only:
-            name += " English"
-
-        if quantization:
-            name += f" ({quantization.upper()})"
-
-        return name
+        metadata = SUPPORTED_MODEL_METADATA.get(model_id)
+        if metadata is not None:
+            return metadata
+        return _parse_model_id(model_id)
 
     def is_model_supported(self, model_id: str) -> bool:
         """Check if a model ID is in the supported list."""
-        return model_id in SUPPORTED_MODELS
+        return model_id in SUPPORTED_MODELS_SET
 
     def validate_model(self, model_id: str) -> None:
         """Validate that a model ID is supported.
@@ -324,16 +419,39 @@ class ModelManager:
     def get_directory_size(self, path: Path) -> int:
         """Calculate the total size of a directory in bytes."""
         total = 0
-        try:
-            for entry in path.rglob("*"):
-                # Skip symlinks to avoid double-counting (HuggingFace cache uses
-                # symlinks in snapshots/ pointing to actual files in blobs/)
-                if entry.is_file() and not entry.is_symlink():
-                    total += entry.stat().st_size
-        except Exception:
-            pass
+        pending = [os.fspath(path)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        # Skip symlinks to avoid double-counting (HuggingFace cache uses
+                        # symlinks in snapshots/ pointing to actual files in blobs/)
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                # Unreadable or vanished directory: count what we can
+                continue
         return total
 
+    def _get_cached_directory_size(
+        self, path: Path, fingerprint: Optional[dict[str, Any]]
+    ) -> int:
+        """Get a directory size, re-walking only when the cache fingerprint changes.
+
+        The fingerprint comes from the HF cache scan, which already stats
+        every file, so added, removed or resized files change it.
+        """
+        key = os.fspath(path)
+        cached = self._size_cache.get(key)
+        if cached is not None and fingerprint is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        size = self.get_directory_size(path)
+        self._size_cache[key] = (fingerprint, size)
+        return size
+
     def get_model_status(self, model_id: str) -> ModelStatus:
         """Get the status of a specific model.
 
@@ -349,27 +467,44 @@ class ModelManager:
         self.validate_model(model_id)
 
         # Check if download is in progress or failed.
-        if model_id in self._download_progress:
-            progress_info = self._download_progress[model_id]
-            if progress_info.get("error"):
+        progress_info = self._download_progress.get(model_id)
+        if progress_info is not None:
+            if progress_info.error:
                 return ModelStatus(
                     id=model_id,
                     status="error",
-                    error=str(progress_info["error"]),
+                    error=progress_info.error,
                 )
             return ModelStatus(
                 id=model_id,
                 status="downloading",
-                progress=progress_info.get("progress", 0.0),
-                downloaded_bytes=progress_info.get("downloaded_bytes"),
-                total_bytes=progress_info.get("total_bytes"),
+                progress=progress_info.progress,
+                downloaded_bytes=progress_info.downloaded_bytes,
+                total_bytes=progress_info.total_bytes,
             )
 
+        # Cache-derived status needs several HF cache scans; reuse it until
+        # an invalidating event or the TTL expires
+        now = time.monotonic()
+        cached = self._status_cache.get(model_id)
+        if cached is not None and now - cached[0] < self.CACHE_TTL_SECONDS:
+            return cached[1]
+
+        generation = self._cache_generation
+        status = self._get_cache_status(model_id)
+        # Don't cache a status computed across an invalidation
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._status_cache[model_id] = (now, status)
+        return status
+
+    def _get_cache_status(self, model_id: str) -> ModelStatus:
+        """Derive model status from the HuggingFace cache and validation state."""
         # Check if downloaded
         cache_path = self.get_model_cache_path(model_id)
         if cache_path and cache_path.exists():
-            size_bytes = self.get_directory_size(cache_path)
             current_fingerprint = self._get_model_cache_fingerprint(model_id)
+            size_bytes = self._get_cached_directory_size(cache_path, current_fingerprint)
             validation_state = self._get_validation_state(model_id)
 
             if (
@@ -413,6 +548,8 @@ class ModelManager:
     def validate_downloaded_model(self, model_id: str) -> None:
         """Validate that a cached model can be fully loaded."""
         self.validate_model(model_id)
+        # Called right after snapshot_download, so rescan the HF cache
+        self._invalidate_caches()
 
         cache_path = self.get_model_cache_path(model_id)
         if not cache_path or not cache_path.exists():
@@ -432,6 +569,9 @@ class ModelManager:
             raise ModelDownloadError(model_id, error_message)
 
         try:
+            # Deferred: importing mlx_whisper loads the whole MLX stack
+            from mlx_whisper.load_models import load_model
+
             model = load_model(str(snapshot_path))
             del model
             gc.collect()
@@ -466,15 +606,10 @@ class ModelManager:
         Raises:
             ModelNotFoundError: If the model is not supported
         """
-        metadata = self.parse_model_id(model_id)
         status = self.get_model_status(model_id)
 
         return {
-            "id": metadata.id,
-            "name": metadata.name,
-            "size": metadata.size,
-            "quantization": metadata.quantization,
-            "english_only": metadata.english_only,
+            **SUPPORTED_MODEL_INFO[model_id],
             "status": status.status,
             "size_bytes": status.size_bytes,
             "download_progress": status.progress,
@@ -489,6 +624,37 @@ class ModelManager:
         """
         return [self.get_model_info(model_id) for model_id in SUPPORTED_MODELS]
 
+    def list_models_json(self) -> bytes:
+        """Get list_models() serialized as a ModelListResponse JSON body.
+
+        The body is cached for CACHE_TTL_SECONDS and invalidated
+        whenever this manager changes download progress or validation
+        state, or deletes a model.
+
+        Returns:
+            JSON bytes of the form {"models": [...]}
+        """
+        now = time.monotonic()
+        cached = self._list_cache
+        if cached is not None and now - cached[0] < self.CACHE_TTL_SECONDS:
+            return cached[1]
+
+        generation = self._cache_generation
+        body = orjson.dumps({"models": self.list_models()})
+        # Don't cache a body computed across an invalidation
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._list_cache = (now, body)
+        return body
+
+    def _invalidate_caches(self) -> None:
+        """Drop the cached HF cache scan, model statuses and model list."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._repo_cache = None
+            self._status_cache = {}
+            self._list_cache = None
+
     def set_download_progress(
         self,
         model_id: str,
@@ -504,11 +670,12 @@ class ModelManager:
             downloaded_bytes: Bytes downloaded so far
             total_bytes: Total bytes to download
         """
-        self._download_progress[model_id] = {
-            "progress": progress,
-            "downloaded_bytes": downloaded_bytes,
-            "total_bytes": total_bytes,
-        }
+        self._download_progress[model_id] = DownloadProgress(
+            progress=progress,
+            downloaded_bytes=downloaded_bytes,
+            total_bytes=total_bytes,
+        )
+        self._invalidate_caches()
 
     def clear_download_progress(self, model_id: str) -> None:
         """Clear download progress tracking for a model.
@@ -517,6 +684,7 @@ class ModelManager:
             model_id: Model identifier
         """
         self._download_progress.pop(model_id, None)
+        self._invalidate_caches()
 
     def is_download_in_progress(self, model_id: str) -> bool:
         """Check if a download is currently in progress for a model.
@@ -528,7 +696,26 @@ class ModelManager:
             True if download is in progress, False otherwise
         """
         progress = self._download_progress.get(model_id)
-        return progress is not None and progress.get("error") is None
+        return progress is not None and progress.error is None
+
+    def _claim_download(self, model_id: str) -> bool:
+        """Mark a download as started unless one is already in progress.
+
+        Concurrent download requests for the same model race between the
+        in-progress check and setting progress, so both run under a lock.
+
+        Args:
+            model_id: Model identifier
+
+        Returns:
+            True if the caller should run the download, False if one is
+            already in progress
+        """
+        with self._progress_lock:
+            if self.is_download_in_progress(model_id):
+                return False
+            self.set_download_progress(model_id, progress=0.0)
+            return True
 
     def download_model(self, model_id: str) -> None:
         """Download a model from HuggingFace Hub synchronously.
@@ -543,20 +730,16 @@ class ModelManager:
             ModelNotFoundError: If the model is not supported
             ModelAlreadyDownloadedError: If the model is already downloaded
         """
-        self.validate_model(model_id)
-
+        # get_model_status validates the model ID first
         status = self.get_model_status(model_id)
         if status.status == "downloaded":
             raise ModelAlreadyDownloadedError(model_id)
 
-        # Check if already downloading
-        if self.is_download_in_progress(model_id):
+        # Initialize progress tracking, unless already downloading
+        if not self._claim_download(model_id):
             return  # Already downloading, don't start another
 
         try:
-            # Initialize progress tracking
-            self.set_download_progress(model_id, progress=0.0)
-
             # Download the model using snapshot_download
             snapshot_download(
                 repo_id=model_id,
@@ -585,19 +768,15 @@ class ModelManager:
             ModelNotFoundError: If the model is not supported
             ModelAlreadyDownloadedError: If the model is already downloaded
         """
-        self.validate_model(model_id)
-
+        # get_model_status validates the model ID first
         status = self.get_model_status(model_id)
         if status.status == "downloaded":
             raise ModelAlreadyDownloadedError(model_id)
 
-        # Check if already downloading
-        if self.is_download_in_progress(model_id):
+        # Initialize progress tracking, unless already downloading
+        if not self._claim_download(model_id):
             return  # Already downloading
 
-        # Initialize progress tracking
-        self.set_download_progress(model_id, progress=0.0)
-
         # Start download in background thread
         thread = threading.Thread(
             target=self._download_in_background,
@@ -613,11 +792,12 @@ class ModelManager:
             model_id: Model identifier
         """
         try:
-            snapshot_download(
-                repo_id=model_id,
-                cache_dir=str(self._hf_hub_cache_path),
-            )
-            self.validate_downloaded_model(model_id)
+            with self._download_slots:
+                snapshot_download(
+                    repo_id=model_id,
+                    cache_dir=str(self._hf_hub_cache_path),
+                )
+                self.validate_downloaded_model(model_id)
             # Download complete - clear progress tracking
             self.clear_download_progress(model_id)
         except Exception as e:
@@ -630,10 +810,8 @@ class ModelManager:
                     cache_fingerprint=self._get_model_cache_fingerprint(model_id),
                     error=error_message,
                 )
-            self._download_progress[model_id] = {
-                "progress": 0.0,
-                "error": str(e),
-            }
+            self._download_progress[model_id] = DownloadProgress(error=str(e))
+            self._invalidate_caches()
 
     def delete_model(self, model_id: str) -> None:
         """Delete a downloaded model from the cache.
@@ -658,6 +836,7 @@ class ModelManager:
         except Exception as e:
             raise RuntimeError(f"Failed to delete model '{model_id}': {e}")
 
+        self._size_cache.pop(os.fspath(cache_path), None)
         self.clear_download_progress(model_id)
         self._clear_validation_state(model_id)
 
@@ -673,14 +852,26 @@ class ModelManager:
             # Best effort cleanup of metadata
             pass
 
+        self._invalidate_caches()
+
 
 # Singleton instance
 _manager: Optional[ModelManager] = None
+_manager_lock = threading.Lock()
 
 
 def get_model_manager() -> ModelManager:
-    """Get the model manager singleton."""
+    """Get the model manager singleton.
+
+    Sync dependencies run in the threadpool, so the first concurrent
+    requests could race to construct it; the lock is only taken until
+    the instance exists.
+    """
     global _manager
-    if _manager is None:
-        _manager = ModelManager()
-    return _manager
+    manager = _manager
+    if manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = ModelManager()
+            manager = _manager
+    return manager
@@ -1,13 +1,24 @@
 """MLX Whisper transcription service."""
 
-import tempfile
-import os
-from pathlib import Path
+import re
+import threading
 from typing import Optional
 
-import mlx_whisper
+from app.config import DEFAULT_MODEL, SUPPORTED_MODELS_SET
 
-from app.config import DEFAULT_MODEL, SUPPORTED_MODELS
+# mlx_whisper pulls in MLX, scipy and numba, so it is imported on first use
+# rather than at app startup. Tests may replace this attribute with a mock.
+mlx_whisper = None
+
+
+def _get_mlx_whisper():
+    """Import mlx_whisper on first use and return the module."""
+    global mlx_whisper
+    if mlx_whisper is None:
+        import mlx_whisper as module
+
+        mlx_whisper = module
+    return mlx_whisper
 
 
 class TranscriptionError(Exception):
@@ -32,11 +43,35 @@ class UnsupportedModelError(Exception):
         super().__init__(f"Model '{model_id}' is not supported")
 
 
+# Error messages meaning the model files are missing: "not found" alongside
+# "model", or a missing file
+_MODEL_MISSING_RE = re.compile(
+    r"no such file or directory|^(?=.*model).*not found",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _classify_mlx_error(model_id: str, error: Exception) -> Optional[Exception]:
+    """Map an exception raised by mlx_whisper to a service exception.
+
+    Args:
+        model_id: Model the failed call used
+        error: Exception raised by mlx_whisper
+
+    Returns:
+        ModelNotDownloadedError if the model files are missing,
+        otherwise None
+    """
+    if _MODEL_MISSING_RE.search(str(error)):
+        return ModelNotDownloadedError(model_id)
+    return None
+
+
 class TranscriptionService:
     """Service for transcribing audio using MLX Whisper."""
 
     # Supported audio formats
-    SUPPORTED_FORMATS = {".wav", ".mp3", ".m4a", ".flac", ".ogg"}
+    SUPPORTED_FORMATS = frozenset({".wav", ".mp3", ".m4a", ".flac", ".ogg"})
 
     def __init__(self):
         """Initialize the transcription service."""
@@ -44,8 +79,12 @@ class TranscriptionService:
 
     def is_supported_format(self, filename: str) -> bool:
         """Check if the audio format is supported."""
-        ext = Path(filename).suffix.lower()
-        return ext in self.SUPPORTED_FORMATS
+        # Split off the suffix directly instead of building a Path
+        head, sep, tail = filename.rpartition(".")
+        if not head:
+            # No dot, or a dotfile like ".wav" (which has no suffix)
+            return False
+        return sep + tail.lower() in self.SUPPORTED_FORMATS
 
     def validate_model(self, model_id: str) -> None:
         """Validate that the model ID is supported.
@@ -56,7 +95,7 @@ class TranscriptionService:
         Raises:
             UnsupportedModelError: If the model is not in the supported list
         """
-        if model_id not in SUPPORTED_MODELS:
+        if model_id not in SUPPORTED_MODELS_SET:
             raise UnsupportedModelError(model_id)
 
     def transcribe(
@@ -96,7 +135,7 @@ class TranscriptionService:
 
         try:
             # Call mlx_whisper transcribe
-            result = mlx_whisper.transcribe(
+            result = _get_mlx_whisper().transcribe(
                 audio_path,
                 path_or_hf_repo=model_id,
                 **transcribe_options,
@@ -114,64 +153,27 @@ class TranscriptionService:
         except FileNotFoundError:
             raise TranscriptionError(f"Audio file not found: {audio_path}")
         except Exception as e:
-            error_msg = str(e).lower()
-            # Check if the error indicates model not downloaded
-            if "not found" in error_msg and "model" in error_msg:
-                raise ModelNotDownloadedError(model_id)
-            if "no such file or directory" in error_msg:
-                raise ModelNotDownloadedError(model_id)
-            raise TranscriptionError(f"Transcription failed: {e}")
-
-    async def transcribe_upload(
-        self,
-        file_content: bytes,
-        filename: str,
-        model: Optional[str] = None,
-        language: Optional[str] = None,
-        prompt: Optional[str] = None,
-    ) -> dict:
-        """Transcribe uploaded audio content.
-
-        Args:
-            file_content: Raw bytes of the audio file
-            filename: Original filename (used to detect format)
-            model: Model identifier
-            language: Two-letter language code
-            prompt: Initial prompt to guide transcription
-
-        Returns:
-            dict with keys: text, language, model
-        """
-        # Get the file extension
-        ext = Path(filename).suffix.lower()
-        if not ext:
-            ext = ".wav"  # Default to wav if no extension
-
-        # Write to a temporary file
-        with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as tmp:
-            tmp.write(file_content)
-            tmp_path = tmp.name
-
-        try:
-            return self.transcribe(
-                audio_path=tmp_path,
-                model=model,
-                language=language,
-                prompt=prompt,
+            raise _classify_mlx_error(model_id, e) or TranscriptionError(
+                f"Transcription failed: {e}"
             )
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
 
 
 # Singleton instance
 _service: Optional[TranscriptionService] = None
+_service_lock = threading.Lock()
 
 
 def get_transcription_service() -> TranscriptionService:
-    """Get the transcription service singleton."""
+    """Get the transcription service singleton.
+
+    Transcriptions run in the threadpool, so the lock guards against
+    racing first calls; it is only taken until the instance exists.
+    """
     global _service
-    if _service is None:
-        _service = TranscriptionService()
-    return _service
+    service = _service
+    if service is None:
+        with _service_lock:
+            if _service is None:
+                _service = TranscriptionService()
+            service = _service
+    return service
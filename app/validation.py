@@ -7,7 +7,6 @@ Provides validation for:
 - Model IDs
 """
 
-import re
 from typing import Optional
 
 from app.errors import (
@@ -21,7 +20,7 @@ MAX_PROMPT_LENGTH = 1000
 
 # ISO 639-1 language codes supported by Whisper
 # This is the subset commonly used; Whisper supports more
-VALID_LANGUAGE_CODES = {
+VALID_LANGUAGE_CODES = frozenset({
     "af", "am", "ar", "as", "az", "ba", "be", "bg", "bn", "bo",
     "br", "bs", "ca", "cs", "cy", "da", "de", "el", "en", "es",
     "et", "eu", "fa", "fi", "fo", "fr", "gl", "gu", "ha", "haw",
@@ -32,10 +31,18 @@ VALID_LANGUAGE_CODES = {
     "ro", "ru", "sa", "sd", "si", "sk", "sl", "sn", "so", "sq",
     "sr", "su", "sv", "sw", "ta", "te", "tg", "th", "tk", "tl",
     "tr", "tt", "uk", "ur", "uz", "vi", "yi", "yo", "yue", "zh",
-}
+})
 
 # Supported audio formats with their file extensions
-SUPPORTED_AUDIO_FORMATS = {".wav", ".mp3", ".m4a", ".flac", ".ogg"}
+SUPPORTED_AUDIO_FORMATS = frozenset({".wav", ".mp3", ".m4a", ".flac", ".ogg"})
+
+# Sorted form, as reported in UnsupportedFormatError details; also the
+# suffix tuple validate_audio_format passes to str.endswith
+SUPPORTED_AUDIO_FORMATS_SORTED = tuple(sorted(SUPPORTED_AUDIO_FORMATS))
+
+# Translation table for sanitize_filename: path separators become
+# underscores and null bytes are deleted, in a single pass
+_FILENAME_TRANSLATION = str.maketrans({"/": "_", "\\": "_", "\x00": None})
 
 
 def validate_language(language: Optional[str]) -> Optional[str]:
@@ -60,11 +67,8 @@ def validate_language(language: Optional[str]) -> Optional[str]:
     if not normalized:
         return None
 
-    # Validate format (should be 2-3 letters)
-    if not re.match(r"^[a-z]{2,3}$", normalized):
-        raise InvalidLanguageError(language)
-
-    # Check if it's a known language code
+    # Check if it's a known language code. Every entry is 2-3 lowercase
+    # letters, so this also rejects malformed codes.
     if normalized not in VALID_LANGUAGE_CODES:
         raise InvalidLanguageError(language)
 
@@ -86,6 +90,11 @@ def validate_prompt(prompt: Optional[str]) -> Optional[str]:
     if prompt is None:
         return None
 
+    # Reject grossly oversized input before copying it with strip().
+    # The slack leaves room for surrounding whitespace.
+    if len(prompt) > MAX_PROMPT_LENGTH * 2:
+        raise PromptTooLongError(len(prompt), MAX_PROMPT_LENGTH)
+
     # Strip whitespace
     sanitized = prompt.strip()
 
@@ -109,11 +118,11 @@ def get_file_extension(filename: str) -> str:
     Returns:
         Lowercase extension including the dot (e.g., ".wav")
     """
-    # Find the last dot in the filename
-    if "." in filename:
-        ext = "." + filename.rsplit(".", 1)[-1].lower()
-        return ext
-    return ""
+    # Slice from the last dot; a leading dot (".hidden") is the extension
+    idx = filename.rfind(".")
+    if idx < 0:
+        return ""
+    return filename[idx:].lower()
 
 
 def validate_audio_format(filename: str) -> str:
@@ -128,15 +137,17 @@ def validate_audio_format(filename: str) -> str:
     Raises:
         UnsupportedFormatError: If the format is not supported
     """
-    ext = get_file_extension(filename)
+    lower = filename.lower()
 
-    if not ext or ext not in SUPPORTED_AUDIO_FORMATS:
+    # Happy path: a single suffix check, no extension extraction
+    if not lower.endswith(SUPPORTED_AUDIO_FORMATS_SORTED):
+        ext = get_file_extension(filename)
         raise UnsupportedFormatError(
             format=ext or "unknown",
-            supported_formats=sorted(SUPPORTED_AUDIO_FORMATS),
+            supported_formats=SUPPORTED_AUDIO_FORMATS_SORTED,
         )
 
-    return ext
+    return lower[lower.rfind("."):]
 
 
 def sanitize_filename(filename: Optional[str]) -> str:
@@ -153,11 +164,12 @@ def sanitize_filename(filename: Optional[str]) -> str:
     if not filename:
         return "audio.wav"
 
-    # Remove path separators to prevent path traversal
-    sanitized = filename.replace("/", "_").replace("\\", "_")
-
-    # Remove any null bytes
-    sanitized = sanitized.replace("\x00", "")
+    # Replace path separators (prevents path traversal) and drop null bytes.
+    # Most names contain none, and the substring checks are much cheaper
+    # than a translate() pass that would change nothing.
+    sanitized = filename
+    if "/" in filename or "\\" in filename or "\x00" in filename:
+        sanitized = filename.translate(_FILENAME_TRANSLATION)
 
     # Remove leading/trailing whitespace and dots
     sanitized = sanitized.strip().strip(".")
@@ -0,0 +1,15 @@
+"""Collection rules for validation micro-benchmarks."""
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless pytest runs with --benchmark-only."""
+    # The option only exists when pytest-benchmark is installed
+    if config.getoption("benchmark_only", default=False):
+        return
+
+    skip = pytest.mark.skip(reason="benchmarks run with --benchmark-only")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
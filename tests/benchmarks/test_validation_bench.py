@@ -0,0 +1,80 @@
+"""Micro-benchmarks for the per-request validation helpers."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from app.validation import (
+    MAX_PROMPT_LENGTH,
+    sanitize_filename,
+    validate_audio_format,
+    validate_language,
+    validate_prompt,
+)
+
+ROUNDS = 1000
+ITERATIONS = 100
+
+# Filenames by input size; 255 characters is the usual filesystem name limit
+FILENAMES = {
+    "short": "audio.wav",
+    "long": "a" * 251 + ".wav",
+}
+
+# Path traversal input sanitize_filename has to rewrite throughout
+TRAVERSAL_FILENAME = "../" * 83 + "a.wav"
+
+
+@pytest.mark.benchmark(group="validation")
+def test_validate_language_bench(benchmark):
+    """Normalize and look up an uppercase language code."""
+    result = benchmark.pedantic(
+        validate_language, args=("EN",), rounds=ROUNDS, iterations=ITERATIONS
+    )
+    assert result == "en"
+
+
+@pytest.mark.benchmark(group="validation")
+@pytest.mark.parametrize("input_size", FILENAMES)
+def test_validate_audio_format_bench(benchmark, input_size):
+    """Accept a supported filename."""
+    result = benchmark.pedantic(
+        validate_audio_format,
+        args=(FILENAMES[input_size],),
+        rounds=ROUNDS,
+        iterations=ITERATIONS,
+    )
+    assert result == ".wav"
+
+
+@pytest.mark.benchmark(group="validation")
+@pytest.mark.parametrize("input_size", FILENAMES)
+def test_sanitize_filename_bench(benchmark, input_size):
+    """Sanitize a filename that needs no changes."""
+    filename = FILENAMES[input_size]
+    result = benchmark.pedantic(
+        sanitize_filename, args=(filename,), rounds=ROUNDS, iterations=ITERATIONS
+    )
+    assert result == filename
+
+
+@pytest.mark.benchmark(group="validation")
+def test_sanitize_traversal_filename_bench(benchmark):
+    """Sanitize a long path traversal filename."""
+    result = benchmark.pedantic(
+        sanitize_filename,
+        args=(TRAVERSAL_FILENAME,),
+        rounds=ROUNDS,
+        iterations=ITERATIONS,
+    )
+    assert "/" not in result
+
+
+@pytest.mark.benchmark(group="validation")
+def test_validate_prompt_at_max_length_bench(benchmark):
+    """Validate a prompt exactly at MAX_PROMPT_LENGTH."""
+    prompt = "a" * MAX_PROMPT_LENGTH
+    result = benchmark.pedantic(
+        validate_prompt, args=(prompt,), rounds=ROUNDS, iterations=ITERATIONS
+    )
+    assert result == prompt
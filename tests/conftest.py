@@ -2,6 +2,7 @@
 
 import pytest
 from pathlib import Path
+from unittest.mock import MagicMock
 from httpx import AsyncClient, ASGITransport
 from app.main import app
 
@@ -10,14 +11,54 @@ from app.main import app
 TEST_MODEL = "mlx-community/whisper-tiny-mlx"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create test client for FastAPI app."""
+    """Create a test client for the FastAPI app, shared across the session."""
     from fastapi.testclient import TestClient
 
     return TestClient(app)
 
 
+@pytest.fixture
+def mock_mlx_whisper(monkeypatch):
+    """Mock mlx_whisper.transcribe to avoid actual model inference."""
+    from app.services import transcription
+
+    # Only transcribe() is used; the spec rejects any other attribute
+    # without importing mlx_whisper for autospec
+    mock = MagicMock(spec=["transcribe"])
+    mock.transcribe.return_value = {
+        "text": " This is a test transcription.",
+        "language": "en",
+    }
+    monkeypatch.setattr(transcription, "mlx_whisper", mock)
+    return mock
+
+
+@pytest.fixture(autouse=True)
+def reset_model_manager_progress():
+    """Clear download progress a test leaves on the shared model manager."""
+    import app.services.model_manager as model_manager_module
+
+    manager = model_manager_module._manager
+    before = set(manager._download_progress) if manager is not None else set()
+
+    yield
+
+    manager = model_manager_module._manager
+    if manager is not None:
+        for model_id in set(manager._download_progress) - before:
+            manager.clear_download_progress(model_id)
+
+
+@pytest.fixture(scope="session")
+def openapi_schema():
+    """Parsed OpenAPI schema, generated once per test session."""
+    from fastapi.testclient import TestClient
+
+    return TestClient(app).get("/openapi.json").json()
+
+
 @pytest.fixture
 async def async_client():
     """Create async test client for FastAPI app."""
@@ -27,13 +68,13 @@ async def async_client():
         yield ac
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_path():
     """Path to test fixtures directory."""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_audio_path(fixtures_path):
     """Path to sample audio file."""
     path = fixtures_path / "audio" / "sample_en.wav"
@@ -42,7 +83,7 @@ def sample_audio_path(fixtures_path):
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def silence_audio_path(fixtures_path):
     """Path to silent audio file."""
     path = fixtures_path / "audio" / "silence.wav"
@@ -51,7 +92,7 @@ def silence_audio_path(fixtures_path):
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def short_audio_path(fixtures_path):
     """Path to short audio file."""
     path = fixtures_path / "audio" / "short.wav"
@@ -60,13 +101,39 @@ def short_audio_path(fixtures_path):
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_audio_bytes(sample_audio_path):
-    """Raw bytes of sample audio for upload testing."""
+    """Raw bytes of sample audio for upload testing (read once per session)."""
     return sample_audio_path.read_bytes()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def warm_model(silence_audio_path):
+    """Load the test model once so real-model tests share it.
+
+    mlx_whisper keeps the most recently loaded model in memory, so later
+    transcriptions with TEST_MODEL skip the load. Tests using this fixture
+    are skipped when the model has not been downloaded; other failures are
+    left for the tests themselves to report.
+    """
+    from app.services.model_manager import get_model_manager
+    from app.services.transcription import (
+        TranscriptionError,
+        get_transcription_service,
+    )
+
+    if get_model_manager().get_model_status(TEST_MODEL).status != "downloaded":
+        pytest.skip(f"Test model not downloaded: {TEST_MODEL}")
+
+    try:
+        get_transcription_service().transcribe(
+            str(silence_audio_path), model=TEST_MODEL
+        )
+    except TranscriptionError:
+        pass
+
+
+@pytest.fixture(scope="session")
 def harvard_audio_path(fixtures_path):
     """Path to Harvard sentences audio file (real speech)."""
     path = fixtures_path / "audio" / "harvard_sample.wav"
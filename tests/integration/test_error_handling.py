@@ -1,18 +1,20 @@
 """Integration tests for standardized error handling."""
 
-import pytest
-
 from app.errors import ErrorCode
 
+# Upload payloads for requests rejected before the audio is read
+NOT_AUDIO = b"not audio content"
+EMPTY_AUDIO = b""
+
 
 class TestTranscribeErrorResponses:
     """Tests for /transcribe endpoint error responses."""
 
-    def test_unsupported_format_returns_structured_error(self, client):
+    async def test_unsupported_format_returns_structured_error(self, async_client):
         """Unsupported format should return structured error response."""
-        response = client.post(
+        response = await async_client.post(
             "/transcribe",
-            files={"file": ("test.txt", b"not audio content", "text/plain")},
+            files={"file": ("test.txt", NOT_AUDIO, "text/plain")},
         )
 
         assert response.status_code == 400
@@ -20,13 +22,13 @@ class TestTranscribeErrorResponses:
         assert data["code"] == ErrorCode.VALIDATION_UNSUPPORTED_FORMAT.value
         assert "error" in data
         assert "details" in data
-        assert "supported_formats" in data["details"]
+        assert data["details"]["supported_formats"] == [".flac", ".m4a", ".mp3", ".ogg", ".wav"]
 
-    def test_empty_file_returns_structured_error(self, client):
+    async def test_empty_file_returns_structured_error(self, async_client):
         """Empty file should return structured error response."""
-        response = client.post(
+        response = await async_client.post(
             "/transcribe",
-            files={"file": ("test.wav", b"", "audio/wav")},
+            files={"file": ("test.wav", EMPTY_AUDIO, "audio/wav")},
         )
 
         assert response.status_code == 400
@@ -34,11 +36,11 @@ class TestTranscribeErrorResponses:
         assert data["code"] == ErrorCode.VALIDATION_EMPTY_FILE.value
         assert "error" in data
 
-    def test_error_response_includes_request_id_header(self, client):
+    async def test_error_response_includes_request_id_header(self, async_client):
         """Error responses should include X-Request-ID header."""
-        response = client.post(
+        response = await async_client.post(
             "/transcribe",
-            files={"file": ("test.txt", b"not audio", "text/plain")},
+            files={"file": ("test.txt", NOT_AUDIO, "text/plain")},
         )
 
         assert "X-Request-ID" in response.headers
@@ -48,9 +50,9 @@ class TestTranscribeErrorResponses:
 class TestModelsErrorResponses:
     """Tests for /models endpoint error responses."""
 
-    def test_model_not_found_returns_structured_error(self, client):
+    async def test_model_not_found_returns_structured_error(self, async_client):
         """Invalid model ID should return structured error response."""
-        response = client.get("/models/invalid-model/status")
+        response = await async_client.get("/models/invalid-model/status")
 
         assert response.status_code == 404
         data = response.json()
@@ -63,24 +65,24 @@ class TestModelsErrorResponses:
 class TestRequestIDMiddleware:
     """Tests for request ID middleware."""
 
-    def test_request_id_in_success_response(self, client):
+    async def test_request_id_in_success_response(self, async_client):
         """Successful requests should include X-Request-ID header."""
-        response = client.get("/health")
+        response = await async_client.get("/health")
 
         assert response.status_code == 200
         assert "X-Request-ID" in response.headers
 
-    def test_request_id_in_error_response(self, client):
+    async def test_request_id_in_error_response(self, async_client):
         """Error responses should include X-Request-ID header."""
-        response = client.get("/models/invalid/status")
+        response = await async_client.get("/models/invalid/status")
 
         assert response.status_code == 404
         assert "X-Request-ID" in response.headers
 
-    def test_client_request_id_preserved(self, client):
+    async def test_client_request_id_preserved(self, async_client):
         """Client-provided X-Request-ID should be preserved."""
         custom_id = "custom-request-123"
-        response = client.get(
+        response = await async_client.get(
             "/health",
             headers={"X-Request-ID": custom_id},
         )
@@ -91,17 +93,17 @@ class TestRequestIDMiddleware:
 class TestHealthEndpoint:
     """Tests for /health endpoint with new response model."""
 
-    def test_health_returns_structured_response(self, client):
+    async def test_health_returns_structured_response(self, async_client):
         """Health endpoint should return structured response."""
-        response = client.get("/health")
+        response = await async_client.get("/health")
 
         assert response.status_code == 200
         data = response.json()
         assert data == {"status": "healthy"}
 
-    def test_health_includes_request_id(self, client):
+    async def test_health_includes_request_id(self, async_client):
         """Health endpoint should include request ID header."""
-        response = client.get("/health")
+        response = await async_client.get("/health")
 
         assert "X-Request-ID" in response.headers
 
@@ -109,10 +111,9 @@ class TestHealthEndpoint:
 class TestOpenAPIDocumentation:
     """Tests for OpenAPI documentation."""
 
-    def test_openapi_includes_error_responses(self, client):
+    def test_openapi_includes_error_responses(self, openapi_schema):
         """OpenAPI schema should document error responses."""
-        response = client.get("/openapi.json")
-        schema = response.json()
+        schema = openapi_schema
 
         # Check /transcribe endpoint has error responses
         transcribe_path = schema["paths"]["/transcribe"]["post"]
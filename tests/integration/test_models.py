@@ -1,10 +1,44 @@
 """Integration tests for model management endpoints."""
 
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+
 import pytest
-from unittest.mock import patch
 
 from app.config import SUPPORTED_MODELS
-from app.services.model_manager import ModelStatus
+from app.main import app
+from app.schemas.models import (
+    DeleteResponse,
+    DownloadResponse,
+    ErrorResponse,
+    ModelInfo,
+    ModelStatusResponse,
+)
+from app.services.model_manager import ModelManager, ModelStatus, get_model_manager
+
+
+@pytest.fixture(scope="module", autouse=True)
+def model_manager(tmp_path_factory):
+    """Inject a ModelManager backed by an empty, isolated HuggingFace cache."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "app.services.model_manager.HUGGINGFACE_CACHE",
+            str(tmp_path_factory.mktemp("huggingface")),
+        )
+        manager = ModelManager()
+
+    app.dependency_overrides[get_model_manager] = lambda: manager
+    yield manager
+    app.dependency_overrides.pop(get_model_manager, None)
+
+
+@pytest.fixture(scope="module")
+def models_by_id(client):
+    """GET /models once and index the entries by model ID."""
+    response = client.get("/models")
+    assert response.status_code == 200
+    return {model["id"]: model for model in response.json()["models"]}
 
 
 class TestListModels:
@@ -31,6 +65,26 @@ class TestListModels:
             assert "status" in model
             assert model["status"] in valid_statuses
 
+    def test_list_models_matches_schema(self, models_by_id):
+        """Each model entry has exactly the documented ModelInfo fields."""
+        for model in models_by_id.values():
+            assert set(model) == set(ModelInfo.model_fields)
+
+    @pytest.mark.parametrize("model_id,expected_size,expected_name", [
+        ("mlx-community/whisper-tiny-mlx", "tiny", "Whisper Tiny"),
+        ("mlx-community/whisper-small-mlx", "small", "Whisper Small"),
+        ("mlx-community/whisper-large-v3-mlx", "large-v3", "Whisper Large V3"),
+        ("mlx-community/whisper-large-v3-mlx-8bit", "large-v3", "Whisper Large V3 (8BIT)"),
+    ])
+    def test_list_models_parses_metadata(
+        self, models_by_id, model_id, expected_size, expected_name
+    ):
+        """Listed models carry metadata parsed from their IDs."""
+        model = models_by_id[model_id]
+        assert model["size"] == expected_size
+        assert model["name"] == expected_name
+        assert model["english_only"] is False
+
 
 class TestModelStatus:
     """Tests for GET /models/{model_id}/status endpoint."""
@@ -45,16 +99,23 @@ class TestModelStatus:
         assert "status" in data
         assert data["id"] == "mlx-community/whisper-tiny-mlx"
         assert data["status"] in {"downloaded", "not_downloaded", "downloading", "error"}
+        assert set(data) == set(ModelStatusResponse.model_fields)
+
+    @pytest.mark.parametrize("model_id", SUPPORTED_MODELS)
+    def test_model_status_all_supported_models(self, client, model_id):
+        """Every supported model has a resolvable status."""
+        response = client.get(f"/models/{model_id}/status")
+
+        assert response.status_code == 200
+        assert response.json()["id"] == model_id
 
     def test_model_status_invalid_id(self, client):
         """Returns 404 for unknown model ID."""
         response = client.get("/models/not-a-real/model/status")
 
         assert response.status_code == 404
-        data = response.json()
-        assert "error" in data
-        assert "code" in data
-        assert "not found" in data["error"].lower()
+        data = ErrorResponse.model_validate(response.json())
+        assert "not found" in data.error.lower()
 
     def test_model_status_url_encoded_id(self, client):
         """Handles URL-encoded model IDs correctly."""
@@ -68,16 +129,21 @@ class TestModelStatus:
 class TestModelDownload:
     """Tests for POST /models/{model_id}/download endpoint."""
 
-    def test_download_model_success(self, client):
+    def test_download_model_success(self, client, model_manager, monkeypatch):
         """POST /models/{id}/download returns 200 and starts download."""
-        with patch(
-            "app.services.model_manager.ModelManager.get_model_cache_path"
-        ) as mock_cache:
-            mock_cache.return_value = None
-            with patch("app.services.model_manager.snapshot_download"):
-                response = client.post(
-                    "/models/mlx-community/whisper-tiny-mlx/download"
-                )
+        validated = threading.Event()
+        monkeypatch.setattr(
+            model_manager,
+            "validate_downloaded_model",
+            MagicMock(side_effect=lambda model_id: validated.set()),
+        )
+
+        with patch("app.services.model_manager.snapshot_download"):
+            response = client.post(
+                "/models/mlx-community/whisper-tiny-mlx/download"
+            )
+            # Keep the mock in place until the background thread is done
+            assert validated.wait(timeout=1.0)
 
         assert response.status_code == 200
         data = response.json()
@@ -85,27 +151,28 @@ class TestModelDownload:
         assert "status" in data
         assert data["id"] == "mlx-community/whisper-tiny-mlx"
         assert data["status"] == "download_started"
+        assert set(data) == set(DownloadResponse.model_fields)
 
     def test_download_model_invalid_id(self, client):
         """Returns 404 for unknown model ID."""
         response = client.post("/models/not-a-real/model/download")
 
         assert response.status_code == 404
-        data = response.json()
-        assert "error" in data
-        assert "not found" in data["error"].lower()
+        data = ErrorResponse.model_validate(response.json())
+        assert "not found" in data.error.lower()
 
-    def test_download_model_already_downloaded(self, client, tmp_path):
+    def test_download_model_already_downloaded(self, client, model_manager, monkeypatch):
         """Returns 409 if model is already downloaded."""
-        with patch(
-            "app.services.model_manager.ModelManager.get_model_status"
-        ) as mock_status:
-            mock_status.return_value = ModelStatus(
+        monkeypatch.setattr(
+            model_manager,
+            "get_model_status",
+            MagicMock(return_value=ModelStatus(
                 id="mlx-community/whisper-tiny-mlx",
                 status="downloaded",
-            )
+            )),
+        )
 
-            response = client.post("/models/mlx-community/whisper-tiny-mlx/download")
+        response = client.post("/models/mlx-community/whisper-tiny-mlx/download")
 
         assert response.status_code == 409
         data = response.json()
@@ -115,24 +182,23 @@ class TestModelDownload:
 class TestModelDelete:
     """Tests for DELETE /models/{model_id} endpoint."""
 
-    def test_delete_model_success(self, client, tmp_path):
-        """DELETE /models/{id} returns 200 and removes files."""
-        fake_cache = tmp_path / "model"
-        fake_cache.mkdir()
-        (fake_cache / "model.bin").write_bytes(b"x" * 100)
-
-        with patch(
-            "app.services.model_manager.ModelManager.get_model_cache_path"
-        ) as mock_cache:
-            mock_cache.return_value = fake_cache
+    def test_delete_model_success(self, client, model_manager, monkeypatch):
+        """DELETE /models/{id} returns 200 and removes the cached model."""
+        fake_cache = MagicMock(spec=Path)
+        fake_cache.exists.return_value = True
+        monkeypatch.setattr(
+            model_manager, "get_model_cache_path", MagicMock(return_value=fake_cache)
+        )
 
+        with patch("app.services.model_manager.shutil.rmtree") as mock_rmtree:
             response = client.delete("/models/mlx-community/whisper-tiny-mlx")
 
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == "mlx-community/whisper-tiny-mlx"
         assert data["status"] == "deleted"
-        assert not fake_cache.exists()
+        assert set(data) == set(DeleteResponse.model_fields)
+        assert mock_rmtree.call_args_list[0] == call(fake_cache)
 
     def test_delete_model_invalid_id(self, client):
         """Returns 404 for unknown model ID."""
@@ -143,13 +209,8 @@ class TestModelDelete:
         assert "not found" in data["error"].lower()
 
     def test_delete_model_not_downloaded(self, client):
-        """Returns 400 if model is not downloaded."""
-        with patch(
-            "app.services.model_manager.ModelManager.get_model_cache_path"
-        ) as mock_cache:
-            mock_cache.return_value = None
-
-            response = client.delete("/models/mlx-community/whisper-tiny-mlx")
+        """Returns 400 if model is not downloaded (the injected cache is empty)."""
+        response = client.delete("/models/mlx-community/whisper-tiny-mlx")
 
         assert response.status_code == 400
         data = response.json()
@@ -1,5 +1,7 @@
 """Unit tests for error handling module."""
 
+import json
+
 import pytest
 from unittest.mock import Mock
 from fastapi import status
@@ -54,6 +56,18 @@ class TestValidationErrors:
         assert exc.details["format"] == ".txt"
         assert exc.details["supported_formats"] == [".wav", ".mp3"]
 
+    def test_unsupported_format_content_matches_model_dump(self):
+        """UnsupportedFormatError fast-path body should match the APIError dump."""
+        exc = UnsupportedFormatError(
+            format=".txt",
+            supported_formats=[".wav", ".mp3"],
+        )
+        for request_id in ("req123", None):
+            expected = exc.to_response(request_id=request_id).model_dump(
+                mode="json", exclude_none=True
+            )
+            assert exc.to_content(request_id=request_id) == expected
+
     def test_file_too_large_error(self):
         """FileTooLargeError should have correct attributes."""
         exc = FileTooLargeError(file_size=150000000, max_size=100000000)
@@ -126,42 +140,50 @@ class TestTranscriptionErrors:
         assert exc.details == {"reason": "corrupted file"}
 
 
+@pytest.fixture(scope="module")
+def mock_request_with_id():
+    """Read-only mock request carrying a request_id, shared by the module."""
+    request = Mock()
+    request.state = Mock()
+    request.state.request_id = "test123"
+    return request
+
+
+@pytest.fixture(scope="module")
+def mock_request_no_id():
+    """Read-only mock request without a request_id, shared by the module."""
+    request = Mock()
+    request.state = Mock(spec=[])  # No request_id attribute
+    return request
+
+
 class TestExceptionHandlers:
     """Tests for exception handler functions."""
 
     @pytest.mark.asyncio
-    async def test_api_exception_handler(self):
+    async def test_api_exception_handler(self, mock_request_with_id):
         """api_exception_handler should return JSON response."""
-        # Create mock request with request_id
-        request = Mock()
-        request.state = Mock()
-        request.state.request_id = "test123"
-
+        request = mock_request_with_id
         exc = ModelNotFoundError(model_id="test-model")
 
         response = await api_exception_handler(request, exc)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
-        # Response body is bytes, need to decode
-        import json
-        body = json.loads(response.body.decode())
+        body = json.loads(response.body)
         assert body["error"] == exc.message
         assert body["code"] == ErrorCode.MODEL_NOT_FOUND.value
         assert body["request_id"] == "test123"
 
     @pytest.mark.asyncio
-    async def test_api_exception_handler_no_request_id(self):
+    async def test_api_exception_handler_no_request_id(self, mock_request_no_id):
         """Handler should work without request_id."""
-        request = Mock()
-        request.state = Mock(spec=[])  # No request_id attribute
-
+        request = mock_request_no_id
         exc = EmptyFileError()
 
         response = await api_exception_handler(request, exc)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        import json
-        body = json.loads(response.body.decode())
+        body = json.loads(response.body)
         assert "request_id" not in body
 
     @pytest.mark.asyncio
@@ -176,8 +198,7 @@ class TestExceptionHandlers:
         response = await unhandled_exception_handler(request, exc)
 
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        import json
-        body = json.loads(response.body.decode())
+        body = json.loads(response.body)
         assert body["code"] == ErrorCode.SERVER_INTERNAL_ERROR.value
         # Should not leak internal error message
         assert "unexpected" not in body["error"].lower()
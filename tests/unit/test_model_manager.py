@@ -1,13 +1,15 @@
 """Unit tests for ModelManager service."""
 
 import pytest
-import time
-from unittest.mock import patch, MagicMock
+import threading
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 from app.services.model_manager import (
+    SUPPORTED_MODEL_INFO,
+    SUPPORTED_MODEL_METADATA,
+    DownloadProgress,
     ModelManager,
-    ModelMetadata,
     ModelStatus,
     ModelNotFoundError,
     ModelAlreadyDownloadedError,
@@ -24,6 +26,14 @@ def isolate_huggingface_cache(tmp_path, monkeypatch):
     monkeypatch.setattr("app.services.model_manager.HUGGINGFACE_CACHE", str(tmp_path))
 
 
+@pytest.fixture
+def cache_root(fs):
+    """In-memory directory for fake model cache files (pyfakefs)."""
+    root = Path("/cache")
+    fs.create_dir(root)
+    return root
+
+
 class TestModelManagerParsing:
     """Tests for model ID parsing."""
 
@@ -44,6 +54,35 @@ class TestModelManagerParsing:
             assert meta.quantization is None or meta.quantization.startswith("q") or meta.quantization.endswith("bit")
             assert meta.english_only is False
 
+    def test_supported_model_metadata_precomputed(self, manager):
+        """Supported models are parsed once at import and returned without reparsing."""
+        assert set(SUPPORTED_MODEL_METADATA) == set(SUPPORTED_MODELS)
+
+        with patch("app.services.model_manager._parse_model_id") as mock_parse, patch.object(
+            manager, "get_model_cache_path", return_value=None
+        ):
+            info = manager.get_model_info("mlx-community/whisper-tiny-mlx")
+
+        mock_parse.assert_not_called()
+        assert info["name"] == "Whisper Tiny"
+
+    def test_model_info_copies_static_fields(self, manager):
+        """Info dicts are fresh copies, so callers can't alter the shared static fields."""
+        model_id = "mlx-community/whisper-tiny-mlx"
+        with patch.object(manager, "get_model_cache_path", return_value=None):
+            info = manager.get_model_info(model_id)
+
+        info["name"] = "changed"
+
+        assert SUPPORTED_MODEL_INFO[model_id]["name"] == "Whisper Tiny"
+        assert "status" not in SUPPORTED_MODEL_INFO[model_id]
+
+    def test_parse_model_id_is_memoized(self, manager):
+        """Repeated parses of an ID share one metadata instance across managers."""
+        model_id = "mlx-community/whisper-large-v3-mlx-8bit"
+
+        assert manager.parse_model_id(model_id) is ModelManager().parse_model_id(model_id)
+
     def test_parse_quantized_model(self, manager):
         """Quantized model ID is parsed with correct quantization metadata."""
         meta = manager.parse_model_id("mlx-community/whisper-large-v3-mlx-8bit")
@@ -54,6 +93,14 @@ class TestModelManagerParsing:
         assert meta.name == "Whisper Large V3 (8BIT)"
         assert meta.english_only is False
 
+    def test_parse_q_quantized_model(self, manager):
+        """A "-q<N>" suffix is parsed as quantization like "-<N>bit"."""
+        meta = manager.parse_model_id("mlx-community/whisper-tiny-mlx-q4")
+
+        assert meta.size == "tiny"
+        assert meta.quantization == "q4"
+        assert meta.name == "Whisper Tiny (Q4)"
+
 
 class TestModelManagerCachePaths:
     """Tests for cache path normalization."""
@@ -118,10 +165,10 @@ class TestModelManagerStatus:
         assert status.path is None
         assert status.size_bytes is None
 
-    def test_get_model_status_downloaded(self, manager, tmp_path):
+    def test_get_model_status_downloaded(self, manager, cache_root):
         """Status is downloaded only when cache exists and validation succeeded."""
         # Create a fake cache directory
-        fake_cache = tmp_path / "model"
+        fake_cache = cache_root / "model"
         fake_cache.mkdir()
         (fake_cache / "model.bin").write_bytes(b"x" * 1000)
         fingerprint = {"commit_hash": "abc123", "size_on_disk": 1000, "nb_files": 1}
@@ -143,9 +190,9 @@ class TestModelManagerStatus:
         assert status.path == str(fake_cache)
         assert status.size_bytes == 1000
 
-    def test_get_model_status_error_when_not_validated(self, manager, tmp_path):
+    def test_get_model_status_error_when_not_validated(self, manager, cache_root):
         """Status is error when cache exists but there is no working validation state."""
-        fake_cache = tmp_path / "model"
+        fake_cache = cache_root / "model"
         fake_cache.mkdir()
         (fake_cache / "model.bin").write_bytes(b"x" * 1000)
 
@@ -211,6 +258,151 @@ class TestModelManagerInfo:
             assert model_id in model_ids
 
 
+class TestModelManagerCaches:
+    """Tests for the HF cache scan, model status and model list caches."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a fresh ModelManager instance."""
+        return ModelManager()
+
+    def test_hf_cache_scan_is_shared(self, manager):
+        """One HF cache scan serves lookups for every model until invalidated."""
+        repo = MagicMock(repo_id="mlx-community/whisper-tiny-mlx", repo_path="/cache/tiny")
+        with patch(
+            "app.services.model_manager.scan_cache_dir",
+            return_value=MagicMock(repos=[repo]),
+        ) as mock_scan:
+            assert manager.get_model_cache_path("mlx-community/whisper-tiny-mlx") == Path("/cache/tiny")
+            assert manager.get_model_cache_path("mlx-community/whisper-small-mlx") is None
+            mock_scan.assert_called_once()
+
+            manager.clear_download_progress("mlx-community/whisper-tiny-mlx")
+            manager.get_model_cache_path("mlx-community/whisper-tiny-mlx")
+
+        assert mock_scan.call_count == 2
+
+    def test_failed_hf_cache_scan_is_not_cached(self, manager):
+        """A failed HF cache scan is retried on the next lookup."""
+        model_id = "mlx-community/whisper-tiny-mlx"
+        repo = MagicMock(repo_id=model_id, repo_path="/cache/tiny")
+        with patch(
+            "app.services.model_manager.scan_cache_dir",
+            side_effect=[OSError("scan failed"), MagicMock(repos=[repo])],
+        ) as mock_scan:
+            assert manager.get_model_status(model_id).status == "not_downloaded"
+            assert manager.get_model_cache_path(model_id) == Path("/cache/tiny")
+
+        assert mock_scan.call_count == 2
+        assert model_id not in manager._status_cache
+
+    def test_directory_size_reused_while_fingerprint_unchanged(self, manager, tmp_path):
+        """Status recomputation skips the directory walk for an unchanged cache."""
+        fingerprint = {"commit_hash": "abc", "size_on_disk": 1000, "nb_files": 2}
+        with patch.object(manager, "get_model_cache_path", return_value=tmp_path), patch.object(
+            manager, "_get_model_cache_fingerprint", return_value=fingerprint
+        ) as mock_fingerprint, patch.object(
+            manager, "get_directory_size", return_value=1000
+        ) as mock_size:
+            manager.get_model_status("mlx-community/whisper-tiny-mlx")
+            manager._invalidate_caches()
+            status = manager.get_model_status("mlx-community/whisper-tiny-mlx")
+            assert mock_size.call_count == 1
+
+            mock_fingerprint.return_value = {**fingerprint, "nb_files": 3}
+            manager._invalidate_caches()
+            manager.get_model_status("mlx-community/whisper-tiny-mlx")
+
+        assert status.size_bytes == 1000
+        assert mock_size.call_count == 2
+
+    def test_list_models_json_is_cached(self, manager):
+        """Repeated calls reuse the serialized body without rescanning."""
+        with patch.object(manager, "list_models", return_value=[]) as mock_list:
+            first = manager.list_models_json()
+            second = manager.list_models_json()
+
+        assert first == second == b'{"models":[]}'
+        mock_list.assert_called_once()
+
+    def test_list_models_json_invalidated_by_progress(self, manager):
+        """Download progress changes invalidate the cached body."""
+        with patch.object(manager, "list_models", return_value=[]) as mock_list:
+            manager.list_models_json()
+            manager.set_download_progress("mlx-community/whisper-tiny-mlx", progress=0.5)
+            manager.list_models_json()
+            manager.clear_download_progress("mlx-community/whisper-tiny-mlx")
+            manager.list_models_json()
+
+        assert mock_list.call_count == 3
+
+    def test_list_models_json_expires_after_ttl(self, manager, monkeypatch):
+        """The cached body is recomputed once the TTL has elapsed."""
+        monkeypatch.setattr(ModelManager, "CACHE_TTL_SECONDS", 0.0)
+
+        with patch.object(manager, "list_models", return_value=[]) as mock_list:
+            manager.list_models_json()
+            manager.list_models_json()
+
+        assert mock_list.call_count == 2
+
+    def test_model_status_is_cached(self, manager):
+        """Cache-derived status is reused without rescanning the HF cache."""
+        with patch.object(manager, "get_model_cache_path", return_value=None) as mock_cache:
+            first = manager.get_model_status("mlx-community/whisper-tiny-mlx")
+            second = manager.get_model_status("mlx-community/whisper-tiny-mlx")
+
+        assert first is second
+        assert first.status == "not_downloaded"
+        mock_cache.assert_called_once()
+
+    def test_model_status_invalidated_by_validation_state(self, manager):
+        """Recording a validation result drops cached statuses."""
+        with patch.object(manager, "get_model_cache_path", return_value=None) as mock_cache:
+            manager.get_model_status("mlx-community/whisper-tiny-mlx")
+            manager._set_validation_state(
+                model_id="mlx-community/whisper-tiny-mlx",
+                state=manager.VALIDATION_STATE_WORKING,
+                cache_fingerprint=None,
+                error=None,
+            )
+            manager.get_model_status("mlx-community/whisper-tiny-mlx")
+
+        assert mock_cache.call_count == 2
+
+    def test_model_status_progress_not_cached(self, manager):
+        """Download progress is always reported live."""
+        with patch.object(manager, "get_model_cache_path", return_value=None):
+            manager.get_model_status("mlx-community/whisper-tiny-mlx")
+            manager.set_download_progress("mlx-community/whisper-tiny-mlx", progress=0.25)
+            status = manager.get_model_status("mlx-community/whisper-tiny-mlx")
+
+        assert status.status == "downloading"
+        assert status.progress == 0.25
+
+    def test_invalidation_waits_for_in_flight_status_store(self, manager):
+        """An invalidation racing a status store can't leave the stale status cached."""
+        model_id = "mlx-community/whisper-tiny-mlx"
+        invalidator = threading.Thread(target=manager._invalidate_caches)
+        blocked = []
+
+        class RacingDict(dict):
+            def __setitem__(self, key, value):
+                # Invalidate between the generation check and the store
+                invalidator.start()
+                invalidator.join(timeout=0.05)
+                blocked.append(invalidator.is_alive())
+                super().__setitem__(key, value)
+
+        manager._status_cache = RacingDict()
+        with patch.object(manager, "get_model_cache_path", return_value=None):
+            manager.get_model_status(model_id)
+        invalidator.join()
+
+        assert blocked == [True]
+        assert model_id not in manager._status_cache
+
+
 class TestModelManagerDownloadProgress:
     """Tests for download progress tracking."""
 
@@ -234,14 +426,24 @@ class TestModelManagerDownloadProgress:
 
         assert "mlx-community/whisper-tiny-mlx" in manager._download_progress
         progress = manager._download_progress["mlx-community/whisper-tiny-mlx"]
-        assert progress["progress"] == 0.5
-        assert progress["downloaded_bytes"] == 500
-        assert progress["total_bytes"] == 1000
+        assert progress == DownloadProgress(
+            progress=0.5, downloaded_bytes=500, total_bytes=1000
+        )
 
         # Clear progress
         manager.clear_download_progress("mlx-community/whisper-tiny-mlx")
         assert "mlx-community/whisper-tiny-mlx" not in manager._download_progress
 
+    def test_download_progress_updates_replace_snapshot(self, manager):
+        """Progress updates never mutate a snapshot a reader already holds."""
+        manager.set_download_progress("mlx-community/whisper-tiny-mlx", progress=0.25)
+        snapshot = manager._download_progress["mlx-community/whisper-tiny-mlx"]
+
+        manager.set_download_progress("mlx-community/whisper-tiny-mlx", progress=0.75)
+
+        assert snapshot.progress == 0.25
+        assert manager._download_progress["mlx-community/whisper-tiny-mlx"].progress == 0.75
+
 
 class TestModelManagerDirectorySize:
     """Tests for directory size calculation."""
@@ -251,23 +453,35 @@ class TestModelManagerDirectorySize:
         """Create a fresh ModelManager instance."""
         return ModelManager()
 
-    def test_get_directory_size(self, manager, tmp_path):
+    def test_get_directory_size(self, manager, cache_root):
         """Calculate directory size correctly, including edge cases."""
         # Empty directory returns 0
-        assert manager.get_directory_size(tmp_path) == 0
+        assert manager.get_directory_size(cache_root) == 0
         # Nonexistent directory returns 0
-        assert manager.get_directory_size(tmp_path / "nonexistent") == 0
+        assert manager.get_directory_size(cache_root / "nonexistent") == 0
 
         # Create test files
-        (tmp_path / "file1.bin").write_bytes(b"x" * 100)
-        (tmp_path / "file2.bin").write_bytes(b"y" * 200)
-        subdir = tmp_path / "subdir"
+        (cache_root / "file1.bin").write_bytes(b"x" * 100)
+        (cache_root / "file2.bin").write_bytes(b"y" * 200)
+        subdir = cache_root / "subdir"
         subdir.mkdir()
         (subdir / "file3.bin").write_bytes(b"z" * 50)
 
-        size = manager.get_directory_size(tmp_path)
+        size = manager.get_directory_size(cache_root)
         assert size == 350
 
+    def test_get_directory_size_skips_symlinks(self, manager, cache_root):
+        """Symlinked files and directories are not counted (HF snapshot layout)."""
+        blobs = cache_root / "blobs"
+        blobs.mkdir()
+        (blobs / "blob").write_bytes(b"x" * 100)
+        snapshots = cache_root / "snapshots"
+        snapshots.mkdir()
+        (snapshots / "weights.npz").symlink_to(blobs / "blob")
+        (snapshots / "linked_dir").symlink_to(blobs, target_is_directory=True)
+
+        assert manager.get_directory_size(cache_root) == 100
+
 
 class TestGetModelManager:
     """Tests for get_model_manager singleton."""
@@ -284,6 +498,27 @@ class TestGetModelManager:
 
         assert manager1 is manager2
 
+    def test_concurrent_first_calls_share_instance(self, monkeypatch):
+        """Racing first calls from worker threads construct a single manager."""
+        import app.services.model_manager as module
+
+        monkeypatch.setattr(module, "_manager", None)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(get_model_manager())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 8
+        assert all(manager is results[0] for manager in results)
+
     def test_returns_model_manager(self):
         """Returns a ModelManager instance."""
         manager = get_model_manager()
@@ -298,12 +533,37 @@ class TestModelManagerDownload:
         """Create a fresh ModelManager instance."""
         return ModelManager()
 
+    def test_concurrent_async_downloads_start_once(self, manager):
+        """Racing download requests for one model start a single download."""
+        barrier = threading.Barrier(8)
+
+        def request_download():
+            barrier.wait()
+            manager.start_download_async("mlx-community/whisper-tiny-mlx")
+
+        started = threading.Event()
+        with patch.object(manager, "get_model_cache_path", return_value=None), patch.object(
+            manager, "set_download_progress", wraps=manager.set_download_progress
+        ) as mock_progress, patch.object(
+            manager, "_download_in_background", side_effect=lambda model_id: started.set()
+        ):
+            threads = [threading.Thread(target=request_download) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert started.wait(timeout=5)
+
+        # Only the request that claimed the download initialized progress
+        mock_progress.assert_called_once_with("mlx-community/whisper-tiny-mlx", progress=0.0)
+        manager.clear_download_progress("mlx-community/whisper-tiny-mlx")
+
     def test_download_model_invalid_model(self, manager):
         """Download raises for invalid model."""
         with pytest.raises(ModelNotFoundError):
             manager.download_model("not-a-real/model")
 
-    def test_download_model_already_downloaded(self, manager, tmp_path):
+    def test_download_model_already_downloaded(self, manager):
         """Download raises if model already downloaded."""
         with patch.object(
             manager,
@@ -399,26 +659,81 @@ class TestModelManagerAsyncDownload:
 
     def test_start_download_async_starts_thread(self, manager):
         """Async download starts a background thread."""
+        started = threading.Event()
+        release = threading.Event()
+        completed = threading.Event()
+
+        def fake_download(**kwargs):
+            started.set()
+            release.wait(timeout=1.0)
+
+        clear_progress = manager.clear_download_progress
+
+        def clear_and_signal(model_id):
+            clear_progress(model_id)
+            completed.set()
+
         with patch.object(manager, "get_model_cache_path", return_value=None):
-            with patch("app.services.model_manager.snapshot_download") as mock_download, patch.object(
-                manager, "validate_downloaded_model"
+            with patch(
+                "app.services.model_manager.snapshot_download", side_effect=fake_download
+            ), patch.object(manager, "validate_downloaded_model"), patch.object(
+                manager, "clear_download_progress", side_effect=clear_and_signal
             ):
-                # Make the mock block briefly to ensure thread starts
-                mock_download.side_effect = lambda **kwargs: time.sleep(0.1)
-
                 manager.start_download_async("mlx-community/whisper-tiny-mlx")
 
-                # Should immediately mark as downloading
+                # Should mark as downloading while the thread is blocked
+                assert started.wait(timeout=1.0)
                 assert manager.is_download_in_progress("mlx-community/whisper-tiny-mlx")
 
-                # Wait for thread to complete
-                time.sleep(0.2)
+                release.set()
+                assert completed.wait(timeout=1.0)
 
                 # Should be cleared after completion
                 assert not manager.is_download_in_progress(
                     "mlx-community/whisper-tiny-mlx"
                 )
 
+    def test_background_downloads_limited_to_available_slots(self, monkeypatch):
+        """Downloads beyond MAX_CONCURRENT_DOWNLOADS wait for a free slot."""
+        monkeypatch.setattr(ModelManager, "MAX_CONCURRENT_DOWNLOADS", 1)
+        manager = ModelManager()
+        first_started = threading.Event()
+        release = threading.Event()
+        started = []
+
+        def fake_download(repo_id, **kwargs):
+            started.append(repo_id)
+            first_started.set()
+            release.wait(timeout=1.0)
+
+        with patch.object(manager, "get_model_cache_path", return_value=None), patch(
+            "app.services.model_manager.snapshot_download", side_effect=fake_download
+        ), patch.object(manager, "validate_downloaded_model"):
+            first = threading.Thread(
+                target=manager._download_in_background,
+                args=("mlx-community/whisper-tiny-mlx",),
+            )
+            second = threading.Thread(
+                target=manager._download_in_background,
+                args=("mlx-community/whisper-small-mlx",),
+            )
+            first.start()
+            assert first_started.wait(timeout=1.0)
+            second.start()
+            second.join(timeout=0.1)
+
+            # The second download is still waiting for the only slot
+            assert started == ["mlx-community/whisper-tiny-mlx"]
+
+            release.set()
+            first.join(timeout=1.0)
+            second.join(timeout=1.0)
+
+        assert started == [
+            "mlx-community/whisper-tiny-mlx",
+            "mlx-community/whisper-small-mlx",
+        ]
+
     def test_start_download_async_skipped_if_already_in_progress(self, manager):
         """Async download is skipped if already in progress."""
         manager.set_download_progress("mlx-community/whisper-tiny-mlx", progress=0.5)
@@ -456,10 +771,10 @@ class TestModelManagerDelete:
 
         assert exc_info.value.model_id == "mlx-community/whisper-tiny-mlx"
 
-    def test_delete_model_success(self, manager, tmp_path):
+    def test_delete_model_success(self, manager, cache_root):
         """Delete removes model from cache, including nested directories."""
         # Create a fake cache directory with subdirectories
-        fake_cache = tmp_path / "model"
+        fake_cache = cache_root / "model"
         fake_cache.mkdir()
         subdir = fake_cache / "subdir"
         subdir.mkdir()
@@ -472,9 +787,9 @@ class TestModelManagerDelete:
         # Directory and all contents should be deleted
         assert not fake_cache.exists()
 
-    def test_delete_model_path_not_exists(self, manager, tmp_path):
+    def test_delete_model_path_not_exists(self, manager, cache_root):
         """Delete raises if cache path returned but doesn't exist."""
-        fake_cache = tmp_path / "nonexistent"
+        fake_cache = cache_root / "nonexistent"
 
         with patch.object(manager, "get_model_cache_path", return_value=fake_cache):
             with pytest.raises(ModelNotDownloadedError):
@@ -0,0 +1,42 @@
+"""Unit tests for response classes."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import orjson
+import pytest
+
+from app.errors import ErrorCode
+from app.responses import FastORJSONResponse
+
+
+class TestFastORJSONResponse:
+    """Tests for FastORJSONResponse rendering."""
+
+    def test_renders_plain_json(self):
+        """JSON-native content is rendered as compact JSON."""
+        response = FastORJSONResponse({"text": "hello", "size_bytes": None})
+        assert response.body == b'{"text":"hello","size_bytes":null}'
+        assert response.media_type == "application/json"
+
+    def test_renders_extended_types(self):
+        """Paths, datetimes, enums, and non-string keys are serialized."""
+        when = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        response = FastORJSONResponse({
+            "path": Path("/tmp/model"),
+            "validated_at": when,
+            "code": ErrorCode.MODEL_NOT_FOUND,
+            1: "one",
+        })
+
+        assert orjson.loads(response.body) == {
+            "path": "/tmp/model",
+            "validated_at": "2024-01-02T03:04:05+00:00",
+            "code": "MODEL_NOT_FOUND",
+            "1": "one",
+        }
+
+    def test_unsupported_type_raises(self):
+        """Unknown types still fail loudly."""
+        with pytest.raises(TypeError):
+            FastORJSONResponse({"value": object()})
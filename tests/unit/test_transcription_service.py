@@ -1,9 +1,11 @@
 """Unit tests for TranscriptionService."""
 
-import pytest
-from unittest.mock import patch, MagicMock
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
 from app.services.transcription import (
     TranscriptionService,
     get_transcription_service,
@@ -11,7 +13,7 @@ from app.services.transcription import (
     ModelNotDownloadedError,
     UnsupportedModelError,
 )
-from app.config import SUPPORTED_MODELS, DEFAULT_MODEL
+from app.config import DEFAULT_MODEL
 
 
 class TestTranscriptionService:
@@ -44,37 +46,63 @@ class TestTranscriptionService:
 
         assert exc_info.value.model_id == "not-a-real/model"
 
-    def test_transcribe_returns_correct_structure(self, service, sample_audio_path):
+    def test_transcribe_returns_correct_structure(
+        self, service, sample_audio_path, mock_mlx_whisper
+    ):
         """Transcribe returns dict with text (stripped), language, model."""
-        with patch("app.services.transcription.mlx_whisper") as mock:
-            mock.transcribe.return_value = {"text": " Hello world. ", "language": "en"}
+        mock_mlx_whisper.transcribe.return_value = {"text": " Hello world. ", "language": "en"}
 
-            result = service.transcribe(str(sample_audio_path))
+        result = service.transcribe(str(sample_audio_path))
 
-            assert "text" in result
-            assert "language" in result
-            assert "model" in result
-            assert result["text"] == "Hello world."  # Stripped
-            assert result["language"] == "en"
-            assert result["model"] == DEFAULT_MODEL
+        assert "text" in result
+        assert "language" in result
+        assert "model" in result
+        assert result["text"] == "Hello world."  # Stripped
+        assert result["language"] == "en"
+        assert result["model"] == DEFAULT_MODEL
 
-    def test_transcribe_model_not_found_error(self, service, sample_audio_path):
+    def test_transcribe_model_not_found_error(
+        self, service, sample_audio_path, mock_mlx_whisper
+    ):
         """Raises ModelNotDownloadedError when model is not found."""
-        with patch("app.services.transcription.mlx_whisper") as mock:
-            mock.transcribe.side_effect = Exception("Model not found in cache")
+        mock_mlx_whisper.transcribe.side_effect = Exception("Model not found in cache")
 
-            with pytest.raises(ModelNotDownloadedError) as exc_info:
-                service.transcribe(str(sample_audio_path))
+        with pytest.raises(ModelNotDownloadedError) as exc_info:
+            service.transcribe(str(sample_audio_path))
 
-            assert exc_info.value.model_id == DEFAULT_MODEL
+        assert exc_info.value.model_id == DEFAULT_MODEL
 
-    def test_transcribe_generic_error(self, service, sample_audio_path):
-        """Raises TranscriptionError for other exceptions."""
-        with patch("app.services.transcription.mlx_whisper") as mock:
-            mock.transcribe.side_effect = Exception("Some random error")
+    def test_transcribe_not_found_without_model_is_generic(
+        self, service, sample_audio_path, mock_mlx_whisper
+    ):
+        """A "not found" error that doesn't mention the model stays a TranscriptionError."""
+        mock_mlx_whisper.transcribe.side_effect = Exception("Audio stream not found")
+
+        with pytest.raises(TranscriptionError):
+            service.transcribe(str(sample_audio_path))
 
-            with pytest.raises(TranscriptionError):
-                service.transcribe(str(sample_audio_path))
+    def test_transcribe_generic_error(self, service, sample_audio_path, mock_mlx_whisper):
+        """Raises TranscriptionError for other exceptions."""
+        mock_mlx_whisper.transcribe.side_effect = Exception("Some random error")
+
+        with pytest.raises(TranscriptionError):
+            service.transcribe(str(sample_audio_path))
+
+
+class TestLazyMLXImport:
+    """Tests for deferred mlx_whisper loading."""
+
+    def test_app_import_does_not_load_mlx_whisper(self):
+        """Importing the app leaves mlx_whisper unloaded until first use."""
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, app.main; assert 'mlx_whisper' not in sys.modules",
+            ],
+            cwd=Path(__file__).parents[2],
+            check=True,
+        )
 
 
 class TestGetTranscriptionService:
@@ -10,6 +10,8 @@ from app.validation import (
     get_file_extension,
     MAX_PROMPT_LENGTH,
     SUPPORTED_AUDIO_FORMATS,
+    SUPPORTED_AUDIO_FORMATS_SORTED,
+    VALID_LANGUAGE_CODES,
 )
 from app.errors import (
     InvalidLanguageError,
@@ -17,6 +19,11 @@ from app.errors import (
     UnsupportedFormatError,
 )
 
+# Parametrize inputs, one test case each
+VALID_CODES = ("en", "fr", "de", "es", "ja", "zh", "ko", "ru")
+INVALID_CODES = ("xx", "invalid", "123", "e", "english", "!@#")
+UNSUPPORTED_FILENAMES = ("audio.txt", "audio.pdf", "audio.aac", "audio.wma")
+
 
 class TestValidateLanguage:
     """Tests for validate_language function."""
@@ -30,29 +37,50 @@ class TestValidateLanguage:
         assert validate_language("") is None
         assert validate_language("  ") is None
 
-    def test_valid_language_codes(self):
-        """Valid ISO 639-1 codes should pass, including uppercase and whitespace."""
-        valid_codes = ["en", "fr", "de", "es", "ja", "zh", "ko", "ru"]
-        for code in valid_codes:
-            assert validate_language(code) == code
+    @pytest.mark.parametrize("code", VALID_CODES)
+    def test_valid_language_codes(self, code):
+        """Valid ISO 639-1 codes should pass unchanged."""
+        assert validate_language(code) == code
+
+    def test_language_code_normalized(self):
+        """Uppercase and surrounding whitespace are normalized away."""
         # Uppercase normalized to lowercase
         assert validate_language("EN") == "en"
         # Whitespace stripped
         assert validate_language("  en  ") == "en"
 
-    def test_invalid_language_code_raises(self):
+    @pytest.mark.parametrize("code", sorted(VALID_LANGUAGE_CODES))
+    def test_all_whisper_languages_valid(self, code):
+        """Every code in VALID_LANGUAGE_CODES should pass."""
+        assert validate_language(code) == code
+        # validate_language relies on every code already being normalized
+        assert code.isascii() and code.isalpha() and code.islower()
+        assert 2 <= len(code) <= 3
+
+    @pytest.mark.parametrize("code", INVALID_CODES)
+    def test_invalid_language_code_raises(self, code):
         """Invalid language codes should raise InvalidLanguageError."""
-        invalid_codes = ["xx", "invalid", "123", "e", "english", "!@#"]
-        for code in invalid_codes:
-            with pytest.raises(InvalidLanguageError) as exc_info:
-                validate_language(code)
-            assert code in str(exc_info.value)
+        with pytest.raises(InvalidLanguageError) as exc_info:
+            validate_language(code)
+        assert code in str(exc_info.value)
 
     def test_three_letter_codes(self):
         """Some three-letter codes are valid (e.g., 'yue' for Cantonese)."""
         assert validate_language("yue") == "yue"
 
 
+@pytest.fixture(scope="session")
+def max_prompt():
+    """Prompt of exactly MAX_PROMPT_LENGTH characters, built once per session."""
+    return "a" * MAX_PROMPT_LENGTH
+
+
+@pytest.fixture(scope="session")
+def over_max_prompt(max_prompt):
+    """Prompt one character over MAX_PROMPT_LENGTH."""
+    return max_prompt + "a"
+
+
 class TestValidatePrompt:
     """Tests for validate_prompt function."""
 
@@ -72,18 +100,27 @@ class TestValidatePrompt:
         # Whitespace stripped
         assert validate_prompt("  hello  ") == "hello"
 
-    def test_prompt_at_max_length(self):
+    def test_prompt_at_max_length(self, max_prompt):
         """Prompt at max length should pass."""
-        prompt = "a" * MAX_PROMPT_LENGTH
-        assert validate_prompt(prompt) == prompt
+        assert validate_prompt(max_prompt) == max_prompt
 
-    def test_prompt_exceeds_max_length_raises(self):
+    def test_prompt_exceeds_max_length_raises(self, over_max_prompt):
         """Prompt exceeding max length should raise PromptTooLongError."""
-        prompt = "a" * (MAX_PROMPT_LENGTH + 1)
         with pytest.raises(PromptTooLongError) as exc_info:
-            validate_prompt(prompt)
+            validate_prompt(over_max_prompt)
         assert str(MAX_PROMPT_LENGTH) in str(exc_info.value)
 
+    def test_oversized_prompt_rejected_before_strip(self):
+        """Prompts far beyond the limit are rejected with their raw length."""
+        prompt = " " * (MAX_PROMPT_LENGTH * 2 + 1)
+        with pytest.raises(PromptTooLongError) as exc_info:
+            validate_prompt(prompt)
+        assert exc_info.value.details["length"] == len(prompt)
+
+    def test_whitespace_padded_prompt_at_max_length(self, max_prompt):
+        """Surrounding whitespace within the slack does not count toward the limit."""
+        assert validate_prompt(f"  {max_prompt}  ") == max_prompt
+
     def test_unicode_prompt(self):
         """Unicode prompts should work."""
         prompt = "日本語のテキスト"
@@ -119,22 +156,26 @@ class TestGetFileExtension:
 class TestValidateAudioFormat:
     """Tests for validate_audio_format function."""
 
-    def test_valid_formats(self):
-        """All supported formats should pass, including uppercase."""
-        for fmt in SUPPORTED_AUDIO_FORMATS:
-            filename = f"audio{fmt}"
-            assert validate_audio_format(filename) == fmt
-        # Uppercase normalized
+    @pytest.mark.parametrize("fmt", SUPPORTED_AUDIO_FORMATS_SORTED)
+    def test_valid_formats(self, fmt):
+        """All supported formats should pass."""
+        assert validate_audio_format(f"audio{fmt}") == fmt
+
+    def test_sorted_formats_match_supported(self):
+        """The precomputed sorted tuple holds exactly the supported formats."""
+        assert SUPPORTED_AUDIO_FORMATS_SORTED == tuple(sorted(SUPPORTED_AUDIO_FORMATS))
+
+    def test_uppercase_format_normalized(self):
+        """Uppercase extensions are normalized to lowercase."""
         assert validate_audio_format("audio.WAV") == ".wav"
 
-    def test_unsupported_format_raises(self):
+    @pytest.mark.parametrize("filename", UNSUPPORTED_FILENAMES)
+    def test_unsupported_format_raises(self, filename):
         """Unsupported formats should raise UnsupportedFormatError."""
-        unsupported = ["audio.txt", "audio.pdf", "audio.aac", "audio.wma"]
-        for filename in unsupported:
-            with pytest.raises(UnsupportedFormatError) as exc_info:
-                validate_audio_format(filename)
-            error = exc_info.value
-            assert error.details["supported_formats"] == sorted(SUPPORTED_AUDIO_FORMATS)
+        with pytest.raises(UnsupportedFormatError) as exc_info:
+            validate_audio_format(filename)
+        error = exc_info.value
+        assert error.details["supported_formats"] is SUPPORTED_AUDIO_FORMATS_SORTED
 
     def test_no_extension_raises(self):
         """Files without extension should raise UnsupportedFormatError."""